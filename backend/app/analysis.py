@@ -116,20 +116,27 @@ def detect_conflicts(assignments: List[Dict]) -> Dict:
                 }
             )
 
-    # Check participant conflicts (same person in two places at once)
-    by_participant = defaultdict(list)
+    # Check participant conflicts (same person in two places at once).
+    # Bucket each participant's assignments by slot so only colliding slots
+    # need ordering, instead of sorting every participant's full list.
+    by_participant: Dict[Any, Dict[tuple, List[Dict]]] = defaultdict(lambda: defaultdict(list))
     for assignment in assignments:
+        slot_key = (assignment.get("date"), assignment.get("start_time"))
         for pid in assignment.get("participant_ids", []):
             if not pid or str(pid).lower() in ("nan", "none", ""):
                 continue
-            by_participant[pid].append(assignment)
-
-    for pid, rows in by_participant.items():
-        rows.sort(key=lambda r: (r.get("date"), r.get("start_time")))
-        for i in range(len(rows) - 1):
-            cur = rows[i]
-            nxt = rows[i + 1]
-            if cur["date"] == nxt["date"] and cur["start_time"] == nxt["start_time"]:
+            by_participant[pid][slot_key].append(assignment)
+
+    for pid, slots in by_participant.items():
+        clashes = [key for key, rows in slots.items() if len(rows) > 1]
+        if not clashes:
+            continue
+        clashes.sort()
+        for key in clashes:
+            rows = slots[key]
+            for i in range(len(rows) - 1):
+                cur = rows[i]
+                nxt = rows[i + 1]
                 conflict_idx += 1
                 conflicts.append(
                     {
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import csv
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -41,20 +42,48 @@ def ensure_dataset(name: str) -> Path:
     return dataset_dir
 
 
+# dataset dir -> (file signature, stats); lets list_datasets skip re-reading unchanged datasets
+_STATS_CACHE: Dict[Path, Tuple[tuple, Dict[str, Any]]] = {}
+
+
+def _dataset_signature(dataset_dir: Path) -> tuple:
+    with os.scandir(dataset_dir) as it:
+        return tuple(sorted((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size) for entry in it))
+
+
+def _cached_dataset_stats(dataset_dir: Path) -> Dict[str, Any]:
+    signature = _dataset_signature(dataset_dir)
+    cached = _STATS_CACHE.get(dataset_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    stats = _dataset_stats(dataset_dir)
+    _STATS_CACHE[dataset_dir] = (signature, stats)
+    return stats
+
+
 def list_datasets() -> List[Dict[str, Any]]:
     entries: List[Dict[str, Any]] = []
+    seen: set[Path] = set()
     for path in sorted(DATA_INPUT_DIR.iterdir()):
         if not path.is_dir():
             continue
+        seen.add(path)
         entry: Dict[str, Any] = {"name": path.name}
         try:
-            entry.update(_dataset_stats(path))
+            entry.update(_cached_dataset_stats(path))
         except Exception:
             entry["error"] = "unreadable"
         entries.append(entry)
+    for stale in _STATS_CACHE.keys() - seen:
+        _STATS_CACHE.pop(stale, None)
     return entries
 
 
+def dataset_signature(name: str) -> tuple:
+    """Cheap version token for a dataset: changes whenever any of its files change."""
+    return _dataset_signature(ensure_dataset(name))
+
+
 def get_dataset_metadata(name: str) -> Dict[str, Any]:
     dataset_dir = ensure_dataset(name)
     metadata = _dataset_stats(dataset_dir)
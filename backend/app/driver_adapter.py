@@ -683,6 +683,10 @@ def transform_batch_to_api(
 
     Returns:
         ExplanationResponse in API format.
+
+    The response models are built with ``model_construct``: every field is
+    derived here from the driver's own JSON output, so per-slot validation
+    would only re-check values this function just produced.
     """
     start_time = time.time()
     explanations: List[DefenseExplanation] = []
@@ -698,7 +702,7 @@ def transform_batch_to_api(
         mus_dict = defense_data.get("mus", {})
         constraint_groups = _transform_mus_dict(mus_dict, slot_calc)
 
-        mus = MUSExplanation(
+        mus = MUSExplanation.model_construct(
             defense_id=defense_id,
             defense_name=student,
             constraint_groups=constraint_groups,
@@ -709,7 +713,7 @@ def transform_batch_to_api(
         mcs_list = defense_data.get("mcs", [])
         mcs_options = _transform_mcs_list(mcs_list, defense_id, slot_calc)
 
-        explanations.append(DefenseExplanation(
+        explanations.append(DefenseExplanation.model_construct(
             defense_id=defense_id,
             mus=mus,
             mcs_options=mcs_options,
@@ -751,7 +755,7 @@ def transform_batch_to_api(
             logger.warning(f"Enhanced explanation computation failed: {e}")
             # Continue without enhanced data
 
-    return ExplanationResponse(
+    return ExplanationResponse.model_construct(
         blocked_defenses=explanations,
         computation_time_ms=elapsed_ms,
         summary=summary,
@@ -814,11 +818,11 @@ def _transform_mus_dict(
     def make_slot_ref(timestamp: str) -> SlotRef:
         """Create SlotRef with computed slot_index."""
         slot_index = slot_calc.timestamp_to_slot_index(timestamp) if slot_calc else 0
-        return SlotRef(timestamp=timestamp, slot_index=slot_index)
+        return SlotRef.model_construct(timestamp=timestamp, slot_index=slot_index)
 
     # Process person-unavailable
     for person, slots in mus_dict.get("person-unavailable", {}).items():
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="person-unavailable",
             entity=person,
             entity_type="person",
@@ -829,7 +833,7 @@ def _transform_mus_dict(
 
     # Process person-overlap (hard constraint)
     for person, slots in mus_dict.get("person-overlap", {}).items():
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="person-overlap",
             entity=person,
             entity_type="person",
@@ -840,7 +844,7 @@ def _transform_mus_dict(
 
     # Process room-unavailable
     for room, slots in mus_dict.get("room-unavailable", {}).items():
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="room-unavailable",
             entity=room,
             entity_type="room",
@@ -851,7 +855,7 @@ def _transform_mus_dict(
 
     # Process room-overlap (hard constraint)
     for room, slots in mus_dict.get("room-overlap", {}).items():
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="room-overlap",
             entity=room,
             entity_type="room",
@@ -862,7 +866,7 @@ def _transform_mus_dict(
 
     # Process extra-room (suggests adding a room)
     for room in mus_dict.get("extra-room", []):
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="pool-expansion",
             entity=room,
             entity_type="room",
@@ -873,7 +877,7 @@ def _transform_mus_dict(
 
     # Process extra-day (suggests adding a day)
     for day_slot in mus_dict.get("extra-day", []):
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="extra-day",
             entity=day_slot,
             entity_type="day",
@@ -884,7 +888,7 @@ def _transform_mus_dict(
 
     # Process enable-room (suggests enabling a disabled room)
     for room in mus_dict.get("enable-room", []):
-        constraint_groups.append(ConstraintGroup(
+        constraint_groups.append(ConstraintGroup.model_construct(
             category="enable-room",
             entity=room,
             entity_type="room",
@@ -913,7 +917,7 @@ def _transform_mcs_list(
         for cg in relaxations:
             cost += max(1, len(cg.slots))
 
-        mcs_options.append(MCSRepair(
+        mcs_options.append(MCSRepair.model_construct(
             mcs_index=idx,
             cost=cost,
             relaxations=relaxations,
@@ -17,9 +17,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from .config import DATA_INPUT_DIR, DATA_OUTPUT_DIR, SOLVER_SRC_DIR
+from .config import DATA_INPUT_DIR, DATA_OUTPUT_DIR
 from .datasets import load_dataset, ensure_dataset
 from .explanation_engine import ExplanationEngine, MUSResult, MCSEnumerationResult
+from .solver_runner import get_solver_module
 from .models.explanation import (
     ConstraintGroup,
     DefenseExplanation,
@@ -48,21 +49,6 @@ class ExplanationConfig:
     compute_mcs: bool = True
 
 
-def _load_solver_module():
-    """Load the solver module dynamically."""
-    import importlib.util
-    import sys
-
-    module_path = SOLVER_SRC_DIR / "solver.py"
-    if module_path.exists():
-        spec = importlib.util.spec_from_file_location("solver", module_path)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            return module
-    raise ImportError(f"Unable to load solver module from {module_path}")
-
-
 class ExplanationService:
     """
     Service for computing explanations for blocked defenses.
@@ -76,7 +62,7 @@ class ExplanationService:
     """
 
     def __init__(self):
-        self._solver_module = _load_solver_module()
+        self._solver_module = get_solver_module()
         self._engine = ExplanationEngine()
 
     def explain_via_driver(
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import mmap
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# JSON files at least this large are parsed straight from a read-only mapping
+MMAP_MIN_BYTES = 1024 * 1024
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file with orjson, mapping large files instead of copying them into a bytes object."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+__all__ = ["MMAP_MIN_BYTES", "read_json"]
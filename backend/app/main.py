@@ -1,28 +1,42 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import errno
+import functools
 import json
 import logging
 import os
+import re
 import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Optional
 
 logger = logging.getLogger("uvicorn.error")
 
-from fastapi import Body, FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import Body, Depends, FastAPI, HTTPException, Request, UploadFile, File, Form
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import orjson
+from pydantic import ValidationError
 import queue
 import threading
 import time
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader
+
 from .analysis import detect_conflicts, validate_schedule_state, ScheduleValidationError
 from .config import DATA_DIR, DATA_INPUT_DIR, DATA_OUTPUT_DIR
-from .datasets import list_datasets
+from .datasets import dataset_signature, list_datasets
 from .explanation_service import get_explanation_service, ExplanationConfig
 from .session_state import get_session_manager
 from .models.explanation import (
@@ -37,6 +51,7 @@ from .models.explanation import (
     ExplainSingleDefenseRequest,
     ApplyRepairsAndResolveRequest,
     ApplyRepairsAndResolveResponse,
+    PlannedDefensesRequest,
     StageRelaxationRequest,
     StagedRelaxationsResponse,
     ValidationResult,
@@ -63,18 +78,42 @@ from .solver_tasks import run_manager, stream_manager, debug_manager
 from .solver_utils import format_solver_response
 from .state_writer import apply_dashboard_state, export_roster_snapshot
 
-app = FastAPI(title="Defense Scheduler API", version="0.1.1")
+# Solver and explanation work gets its own threads so it never queues ahead of
+# the default executor used by FastAPI's sync handlers.
+solver_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="solver")
 
 
-def _unique(seq: list[str]) -> list[str]:
-    seen = set()
-    result = []
-    for item in seq:
-        if item in seen:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    solver_pool.shutdown(wait=False)
+
+
+app = FastAPI(
+    title="Defense Scheduler API",
+    version="0.1.1",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+session_manager = get_session_manager()
+
+
+_DEFAULT_ORIGINS = (
+    "http://localhost",
+    "http://127.0.0.1",
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:5175",
+    "http://127.0.0.1:5175",
+    "http://localhost:4173",
+    "http://127.0.0.1:4173",
+)
+
+
+def _unique(seq: Iterable[str]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(seq))
 
 
 def _normalize_host(value: str) -> str | None:
@@ -94,24 +133,12 @@ def _parse_origins(value: str | None) -> list[str]:
     return [entry.strip() for entry in value.split(",") if entry.strip()]
 
 
-def _resolve_allowed_origins() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _resolve_allowed_origins() -> tuple[str, ...]:
     explicit = _parse_origins(os.getenv("ALLOWED_ORIGINS"))
     if explicit:
         return _unique(explicit)
 
-    default_origins = [
-        "http://localhost",
-        "http://127.0.0.1",
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-        "http://localhost:5175",
-        "http://127.0.0.1:5175",
-        "http://localhost:4173",
-        "http://127.0.0.1:4173",
-    ]
-
     extra_hosts = _parse_origins(os.getenv("FRONTEND_HOSTS"))
     normalized = []
     for host in extra_hosts:
@@ -119,7 +146,14 @@ def _resolve_allowed_origins() -> list[str]:
         if resolved:
             normalized.append(resolved)
 
-    return _unique(default_origins + normalized)
+    return _unique(_DEFAULT_ORIGINS + tuple(normalized))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_solver_config_yaml(text: str) -> Any:
+    # Re-solves resubmit the same YAML. The cached document is shared, so
+    # callers must deep-copy it (as solver_runner does for dataset configs).
+    return yaml.load(text, Loader=_YAMLLoader)
 
 
 def _extract_solver_config(req: SolveRequest) -> tuple[Dict[str, Any], Optional[str]]:
@@ -129,26 +163,29 @@ def _extract_solver_config(req: SolveRequest) -> tuple[Dict[str, Any], Optional[
         overrides.update(req.solver_config)
     if config_yaml:
         try:
-            loaded = yaml.safe_load(config_yaml) or {}
+            loaded = _parse_solver_config_yaml(config_yaml) or {}
         except yaml.YAMLError as exc:
             raise HTTPException(status_code=400, detail=f"Invalid solver_config_yaml: {exc}")
         if not isinstance(loaded, dict):
             raise HTTPException(status_code=400, detail="solver_config_yaml must define a mapping")
-        overrides.update(loaded)
+        overrides.update(copy.deepcopy(loaded))
     return overrides, config_yaml
 
 
+ALLOWED_ORIGINS = _resolve_allowed_origins()
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=_resolve_allowed_origins(),
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=600,  # let browsers reuse preflight results for 10 minutes
 )
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for monitoring and container orchestration."""
     return {
         "status": "healthy",
@@ -157,19 +194,25 @@ def health_check():
     }
 
 
-@app.get("/api/datasets")
-def get_datasets():
+def _list_input_datasets():
     DATA_INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    items = list_datasets()
-    return items
+    return list_datasets()
+
+
+@app.get("/api/datasets")
+async def get_datasets():
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _list_input_datasets)
+
+
+_DATASET_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
 
 
 def _validate_dataset_name(value: str) -> str:
     value = value.strip()
     if not value:
         raise HTTPException(status_code=400, detail="dataset_id is required")
-    allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_")
-    if any(ch not in allowed for ch in value):
+    if not _DATASET_NAME_RE.fullmatch(value):
         raise HTTPException(
             status_code=400,
             detail="dataset_id may only contain letters, numbers, dashes, and underscores",
@@ -177,37 +220,63 @@ def _validate_dataset_name(value: str) -> str:
     return value
 
 
-@app.post("/api/datasets/upload")
-async def upload_dataset(dataset_id: str = Form(...), archive: UploadFile = File(...)):
-    DATA_INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    safe_name = _validate_dataset_name(dataset_id)
-    filename = archive.filename or ""
-    if not filename.lower().endswith(".zip"):
-        raise HTTPException(status_code=400, detail="Please upload a .zip archive")
+_ARCHIVE_COPY_BUFSIZE = 1024 * 1024
+
+
+def _extract_zip(source: Path | BinaryIO, extract_dir: Path) -> set[str]:
+    """
+    Extract an uploaded archive with 1 MiB copy blocks, rejecting paths outside extract_dir.
 
-    temp_dir = Path(tempfile.mkdtemp(prefix="dataset-upload-"))
+    Returns the extracted file paths relative to extract_dir (POSIX separators).
+    """
+    root = extract_dir.resolve()
+    extracted: set[str] = set()
     try:
-        zip_path = temp_dir / "archive.zip"
-        with zip_path.open("wb") as buffer:
-            while True:
-                chunk = await archive.read(1024 * 1024)
-                if not chunk:
-                    break
-                buffer.write(chunk)
+        zf = zipfile.ZipFile(source, allowZip64=True)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Uploaded file is not a valid .zip archive")
+    with zf:
+        for info in zf.infolist():
+            target = (root / info.filename).resolve()
+            if target != root and root not in target.parents:
+                raise HTTPException(status_code=400, detail=f"Archive entry escapes dataset folder: {info.filename}")
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, _ARCHIVE_COPY_BUFSIZE)
+            extracted.add(target.relative_to(root).as_posix())
+    return extracted
+
+
+_REQUIRED_DATASET_FILES = ("defences.csv", "unavailabilities.csv", "timeslot_info.json", "rooms.json")
+
 
+def _install_uploaded_dataset(archive_file: BinaryIO, safe_name: str) -> None:
+    """Extract an uploaded archive and move it into DATA_INPUT_DIR/<safe_name>."""
+    # Stage next to the input folder so the finished dataset can be renamed into place
+    temp_dir = Path(tempfile.mkdtemp(prefix=".dataset-upload-", dir=DATA_DIR))
+    try:
+        # The multipart parser already spooled the upload into a seekable temp file,
+        # so read the archive from it directly instead of copying it to disk again.
         extract_dir = temp_dir / "extracted"
         extract_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(zip_path) as zf:
-            zf.extractall(extract_dir)
+        extracted = _extract_zip(archive_file, extract_dir)
 
+        # Resolve the dataset root from the extracted names rather than probing the disk:
+        # either the files sit at the top level or inside a single wrapping folder.
         base_dir = extract_dir
-        required_files = ["defences.csv", "unavailabilities.csv", "timeslot_info.json", "rooms.json"]
-        if not all((base_dir / name).exists() for name in required_files):
-            contents = list(base_dir.iterdir())
-            if len(contents) == 1 and contents[0].is_dir():
-                base_dir = contents[0]
-
-        missing = [name for name in required_files if not (base_dir / name).exists()]
+        prefix = ""
+        if not all(name in extracted for name in _REQUIRED_DATASET_FILES):
+            top_level = {path.split("/", 1)[0] for path in extracted}
+            if len(top_level) == 1:
+                folder = next(iter(top_level))
+                if folder not in extracted:
+                    base_dir = extract_dir / folder
+                    prefix = f"{folder}/"
+
+        missing = [name for name in _REQUIRED_DATASET_FILES if f"{prefix}{name}" not in extracted]
         if missing:
             raise HTTPException(
                 status_code=400,
@@ -217,20 +286,30 @@ async def upload_dataset(dataset_id: str = Form(...), archive: UploadFile = File
         target_dir = DATA_INPUT_DIR / safe_name
         if target_dir.exists():
             shutil.rmtree(target_dir)
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        for entry in base_dir.iterdir():
-            destination = target_dir / entry.name
-            if entry.is_dir():
-                shutil.copytree(entry, destination)
-            else:
-                shutil.copy2(entry, destination)
-
-        return {"status": "uploaded", "dataset": safe_name}
+        try:
+            os.replace(base_dir, target_dir)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.copytree(base_dir, target_dir)
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@app.post("/api/datasets/upload")
+async def upload_dataset(dataset_id: str = Form(...), archive: UploadFile = File(...)):
+    DATA_INPUT_DIR.mkdir(parents=True, exist_ok=True)
+    safe_name = _validate_dataset_name(dataset_id)
+    filename = archive.filename or ""
+    if not filename.lower().endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Please upload a .zip archive")
+
+    # Extraction and the directory swap are blocking disk work; keep them off the event loop
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, _install_uploaded_dataset, archive.file, safe_name)
+    return {"status": "uploaded", "dataset": safe_name}
+
+
 @app.delete("/api/datasets/{dataset_id}")
 def delete_dataset(dataset_id: str):
     safe_name = _validate_dataset_name(dataset_id)
@@ -524,7 +603,7 @@ def add_unavailability(dataset_id: str, payload: Dict[str, Any] = Body(...)):
 
 
 @app.post("/api/datasets/{dataset_id}/repairs")
-def save_repairs_endpoint(dataset_id: str, payload: Dict[str, Any] = Body(...)):
+async def save_repairs_endpoint(dataset_id: str, payload: Dict[str, Any] = Body(...)):
     """Save active repair strings to the dataset's active_repairs.json metadata file."""
     safe_name = _validate_dataset_name(dataset_id)
     repair_strings = payload.get("repair_strings", [])
@@ -533,8 +612,11 @@ def save_repairs_endpoint(dataset_id: str, payload: Dict[str, Any] = Body(...)):
 
     display = payload.get("display")  # Optional UI display metadata
 
+    loop = asyncio.get_event_loop()
     try:
-        save_active_repairs(safe_name, repair_strings, display=display)
+        await loop.run_in_executor(
+            None, functools.partial(save_active_repairs, safe_name, repair_strings, display=display)
+        )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
 
@@ -572,11 +654,58 @@ def load_schedule(payload: Dict[str, Any] = Body(...)):
         schedule = build_schedule_payload(dataset)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Dataset not found")
-    return schedule
+    # The payload is plain JSON data built by the server; skip jsonable_encoder's walk.
+    return ORJSONResponse(schedule)
+
+
+def _inline_schema_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            return _inline_schema_refs(defs[ref[len("#/$defs/"):]], defs)
+        return {key: _inline_schema_refs(value, defs) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_inline_schema_refs(value, defs) for value in node]
+    return node
+
 
+def _request_body_openapi(model) -> Dict[str, Any]:
+    """openapi_extra declaring ``model`` as the JSON body of a route that reads it itself.
 
-@app.post("/api/schedule/solve")
-async def solve_schedule(req: SolveRequest):
+    The nested models are inlined: ``#/$defs`` refs would not resolve inside
+    the OpenAPI document.
+    """
+    schema = model.model_json_schema()
+    schema = _inline_schema_refs(schema, schema.pop("$defs", {}))
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema}},
+            "required": True,
+        }
+    }
+
+
+# _solve_request_body reads the raw request, so FastAPI can't see the body
+# model; publish it explicitly to keep it in /docs.
+_SOLVE_REQUEST_OPENAPI = _request_body_openapi(SolveRequest)
+
+
+async def _solve_request_body(request: Request) -> SolveRequest:
+    """Validate a SolveRequest straight from the raw body.
+
+    pydantic-core parses the JSON into the model in one pass instead of
+    json.loads building the full entities/timeslots dicts first.
+    """
+    try:
+        return SolveRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        )
+
+
+@app.post("/api/schedule/solve", openapi_extra=_SOLVE_REQUEST_OPENAPI)
+async def solve_schedule(req: SolveRequest = Depends(_solve_request_body)):
     dataset_id = req.data.dataset_id
     config_overrides, config_yaml = _extract_solver_config(req)
     opts = SolverOptions(
@@ -593,28 +722,35 @@ async def solve_schedule(req: SolveRequest):
         enabled_room_ids=req.enabled_room_ids,
     )
     loop = asyncio.get_event_loop()
-    raw = await loop.run_in_executor(None, runner.solve, opts)
-    return format_solver_response(raw, opts)
+    raw = await loop.run_in_executor(solver_pool, runner.solve, opts)
+    # format_solver_response already reduces everything to native JSON types;
+    # hand the dict straight to orjson instead of walking it with jsonable_encoder.
+    return ORJSONResponse(format_solver_response(raw, opts))
+
+
+def _run_to_dict(record) -> Dict[str, Any]:
+    return {
+        "run_id": record.id,
+        "dataset_id": record.dataset_id,
+        "status": record.status,
+        "created_at": record.created_at,
+        "started_at": record.started_at,
+        "finished_at": record.finished_at,
+        "solver": record.solver,
+        "timeout": record.timeout,
+        "error": record.error,
+        "result": record.result,
+        "solutions": record.solutions,
+    }
 
 
 def _run_to_response(record) -> SolverRunResponse:
-    return SolverRunResponse(
-        run_id=record.id,
-        dataset_id=record.dataset_id,
-        status=record.status,
-        created_at=record.created_at,
-        started_at=record.started_at,
-        finished_at=record.finished_at,
-        solver=record.solver,
-        timeout=record.timeout,
-        error=record.error,
-        result=record.result,
-        solutions=record.solutions,
-    )
+    # Records are built internally with the right types; skip field validation.
+    return SolverRunResponse.model_construct(**_run_to_dict(record))
 
 
-@app.post("/api/solver/runs")
-def create_solver_run(req: SolveRequest) -> SolverRunResponse:
+@app.post("/api/solver/runs", openapi_extra=_SOLVE_REQUEST_OPENAPI)
+def create_solver_run(req: SolveRequest = Depends(_solve_request_body)) -> SolverRunResponse:
     dataset_id = req.data.dataset_id
     config_overrides, config_yaml = _extract_solver_config(req)
     # Convert availability overrides from Pydantic to dataclass format
@@ -663,7 +799,7 @@ def create_solver_run(req: SolveRequest) -> SolverRunResponse:
 
 
 @app.get("/api/solver/runs/{run_id}/stream")
-def stream_solver_run(run_id: str):
+async def stream_solver_run(run_id: str):
     import logging
     sse_logger = logging.getLogger("uvicorn.error")
     record = run_manager.get(run_id)
@@ -673,30 +809,34 @@ def stream_solver_run(run_id: str):
     if not channel:
         raise HTTPException(status_code=404, detail="Streaming not enabled for this run")
 
-    def event_stream():
+    async def event_stream():
         sse_logger.info("sse.start run_id=%s", run_id)
-        q = channel.subscribe()
+        subscriber = channel.subscribe_async()
+        q = subscriber.queue
         sse_logger.info("sse.subscribed run_id=%s qsize=%d", run_id, q.qsize())
-        yield _sse_event("meta", {"run_id": run_id})
-        event_count = 0
-        while True:
-            try:
-                payload = q.get(timeout=10)
-            except queue.Empty:
-                sse_logger.info("sse.heartbeat run_id=%s events_so_far=%d", run_id, event_count)
-                yield _sse_event("heartbeat", {"ts": time.time()})
-                continue
-            if payload is None:
-                sse_logger.info("sse.end run_id=%s total_events=%d", run_id, event_count)
-                break
-            event_type = payload.get("type", "snapshot")
-            data = payload.get("payload", payload)
-            event_count += 1
-            sse_logger.info("sse.yield run_id=%s type=%s count=%d", run_id, event_type, event_count)
-            yield _sse_event(event_type, data)
-            if event_type in {"final", "solver-error", "close"}:
-                sse_logger.info("sse.terminal run_id=%s type=%s", run_id, event_type)
-                break
+        try:
+            yield _sse_event("meta", {"run_id": run_id})
+            event_count = 0
+            while True:
+                try:
+                    payload = await asyncio.wait_for(q.get(), timeout=10)
+                except asyncio.TimeoutError:
+                    sse_logger.info("sse.heartbeat run_id=%s events_so_far=%d", run_id, event_count)
+                    yield _sse_event("heartbeat", {"ts": time.time()})
+                    continue
+                if payload is None:
+                    sse_logger.info("sse.end run_id=%s total_events=%d", run_id, event_count)
+                    break
+                event_type = payload.get("type", "snapshot")
+                data = payload.get("payload", payload)
+                event_count += 1
+                sse_logger.info("sse.yield run_id=%s type=%s count=%d", run_id, event_type, event_count)
+                yield _sse_event(event_type, data)
+                if event_type in {"final", "solver-error", "close"}:
+                    sse_logger.info("sse.terminal run_id=%s type=%s", run_id, event_type)
+                    break
+        finally:
+            channel.unsubscribe(subscriber)
 
     return StreamingResponse(
         event_stream(),
@@ -706,7 +846,7 @@ def stream_solver_run(run_id: str):
 
 
 @app.get("/api/solver/runs/{run_id}/debug")
-def stream_solver_debug(run_id: str):
+async def stream_solver_debug(run_id: str):
     record = run_manager.get(run_id)
     if not record:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -714,25 +854,30 @@ def stream_solver_debug(run_id: str):
     if not channel:
         raise HTTPException(status_code=404, detail="Debug stream not available for this run")
 
-    def event_stream():
+    async def event_stream():
+        # Replay the backlog as one frame so late subscribers don't pay one event per line
         history = list(record.debug_lines)
-        for line in history:
-            yield _sse_event("log", {"line": line})
+        if history:
+            yield _sse_event("log-batch", {"lines": history})
         if record.status in {"succeeded", "failed", "cancelled"}:
             yield _sse_event("close", {"status": record.status})
             return
-        q = channel.subscribe()
-        yield _sse_event("meta", {"run_id": run_id})
-        while True:
-            try:
-                line = q.get(timeout=10)
-            except queue.Empty:
-                yield _sse_event("heartbeat", {"ts": time.time()})
-                continue
-            if line is None:
-                yield _sse_event("close", {"status": record.status})
-                break
-            yield _sse_event("log", {"line": line})
+        subscriber = channel.subscribe_async()
+        q = subscriber.queue
+        try:
+            yield _sse_event("meta", {"run_id": run_id})
+            while True:
+                try:
+                    line = await asyncio.wait_for(q.get(), timeout=10)
+                except asyncio.TimeoutError:
+                    yield _sse_event("heartbeat", {"ts": time.time()})
+                    continue
+                if line is None:
+                    yield _sse_event("close", {"status": record.status})
+                    break
+                yield _sse_event("log", {"line": line})
+        finally:
+            channel.unsubscribe(subscriber)
 
     return StreamingResponse(
         event_stream(),
@@ -741,12 +886,15 @@ def stream_solver_debug(run_id: str):
     )
 
 
-def _sse_event(event_type: str, data: Dict[str, Any]) -> str:
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+_SSE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _sse_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(data, option=_SSE_JSON_OPTIONS) + b"\n\n"
 
 
 @app.get("/api/solver/runs/{run_id}")
-def read_solver_run(run_id: str) -> SolverRunResponse:
+async def read_solver_run(run_id: str) -> SolverRunResponse:
     record = run_manager.get(run_id)
     if not record:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -754,12 +902,14 @@ def read_solver_run(run_id: str) -> SolverRunResponse:
 
 
 @app.get("/api/solver/runs/{run_id}/debug-lines")
-def read_solver_debug_lines(run_id: str) -> Dict[str, Any]:
+async def read_solver_debug_lines(run_id: str) -> Dict[str, Any]:
     record = run_manager.get(run_id)
     if not record:
         raise HTTPException(status_code=404, detail="Run not found")
-    return JSONResponse(
-        {"lines": list(record.debug_lines)},
+    # orjson serializes the list in one call without releasing the GIL, so the
+    # appending worker thread can't interleave; no defensive copy needed.
+    return ORJSONResponse(
+        {"lines": record.debug_lines},
         headers={"Cache-Control": "no-store"},
     )
 
@@ -773,21 +923,40 @@ def cancel_solver_run(run_id: str) -> Dict[str, Any]:
 
 
 @app.get("/api/solver/runs")
-def list_solver_runs(dataset_id: Optional[str] = None) -> Dict[str, Any]:
-    runs = []
-    for record in run_manager.list_runs().values():
-        if dataset_id and record.dataset_id != dataset_id:
-            continue
-        runs.append(_run_to_response(record))
-    return {"runs": runs}
+async def list_solver_runs(dataset_id: Optional[str] = None):
+    # Records are already plain data; skip pydantic and serialize straight to bytes.
+    runs = [_run_to_dict(record) for record in run_manager.list_records(dataset_id or None)]
+    return ORJSONResponse({"runs": runs})
+
+
+# dataset id -> (dataset signature, capacity gaps); /explain and /repairs both need the
+# gaps of the same must-plan-all solve, so only the first call per dataset version solves.
+_capacity_gaps_cache: Dict[str, tuple] = {}
+_capacity_gaps_lock = threading.Lock()
+
+
+def _capacity_gaps(dataset_id: str) -> list:
+    try:
+        signature = dataset_signature(dataset_id)
+    except FileNotFoundError:
+        signature = None
+    with _capacity_gaps_lock:
+        cached = _capacity_gaps_cache.get(dataset_id)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+    gaps = runner.solve(
+        SolverOptions(dataset=dataset_id, must_plan_all=True)
+    ).get("capacity_gaps", [])
+    if signature is not None:
+        with _capacity_gaps_lock:
+            _capacity_gaps_cache[dataset_id] = (signature, gaps)
+    return gaps
 
 
 @app.post("/api/schedule/explain")
 def explain_schedule(req: ExplainRequest):
     # simple placeholder derived from capacity gaps
-    gaps = runner.solve(
-        SolverOptions(dataset=req.data.dataset_id, must_plan_all=True)
-    ).get("capacity_gaps", [])
+    gaps = _capacity_gaps(req.data.dataset_id)
     muses = []
     for idx, gap in enumerate(gaps):
         muses.append(
@@ -818,9 +987,8 @@ def explain_schedule(req: ExplainRequest):
 
 @app.post("/api/schedule/repairs")
 def generate_repairs(req: RepairsRequest):
-    result = runner.solve(SolverOptions(dataset=req.data.dataset_id, must_plan_all=True))
     repairs = []
-    for cand in result.get("capacity_gaps", [])[:5]:
+    for cand in _capacity_gaps(req.data.dataset_id)[:5]:
         repairs.append(
             {
                 "id": f"repair-{cand['resource']}",
@@ -845,16 +1013,20 @@ def export_solution(req: ExportRequest):
     fmt = req.format.lower()
     if fmt != "json":
         raise HTTPException(status_code=400, detail="Only JSON export supported in this build")
-    content = json.dumps(req.solution, indent=2).encode("utf-8")
-    temp_path = Path("/tmp/schedule_export.json")
-    temp_path.write_bytes(content)
-    return FileResponse(temp_path, media_type="application/json", filename="schedule.json")
+    content = orjson.dumps(req.solution, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"Content-Disposition": 'attachment; filename="schedule.json"'},
+    )
 
 
 @app.post("/api/schedule/participant/{participant_id}")
 def participant_schedule(participant_id: str, req: ParticipantRequest):
-    assignments = req.solution.get("assignments", [])
-    filtered = [a for a in assignments if participant_id in a.get("participant_ids", [])]
+    # The solution arrives with each request, so one pass is the cheapest lookup;
+    # an index would cost the same scan to build and could not be reused.
+    assignments = req.solution.get("assignments") or ()
+    filtered = [a for a in assignments if participant_id in (a.get("participant_ids") or ())]
     return {"participant_id": participant_id, "assignments": filtered}
 
 
@@ -865,35 +1037,44 @@ def schedule_conflicts(req: ConflictsRequest):
 
 
 @app.get("/api/snapshots")
-def get_snapshots():
-    return list_snapshots()
+async def get_snapshots():
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, list_snapshots)
 
 
 @app.post("/api/snapshots")
 def create_snapshot(req: SnapshotRequest):
     snap = save_snapshot(req.name, req.description, req.state)
+    assignments = req.state.get("assignments") or ()
+    entities = req.state.get("entities") or ()
     return {
         "id": snap.id,
         "name": snap.name,
         "description": snap.description,
         "created_at": snap.created_at,
-        "size_bytes": snap.path.stat().st_size,
-        "roster_count": len(req.state.get("assignments", [])),
-        "event_count": len(req.state.get("entities", [])),
+        "size_bytes": snap.size_bytes,
+        "roster_count": len(assignments),
+        "event_count": len(entities),
     }
 
 
 @app.get("/api/snapshots/{snapshot_id}")
-def read_snapshot(snapshot_id: str):
+async def read_snapshot(snapshot_id: str):
+    loop = asyncio.get_event_loop()
     try:
-        return load_snapshot(snapshot_id)
+        return await loop.run_in_executor(None, load_snapshot, snapshot_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Snapshot not found")
 
 
 @app.delete("/api/snapshots/{snapshot_id}")
 def remove_snapshot(snapshot_id: str):
-    delete_snapshot(snapshot_id)
+    try:
+        delete_snapshot(snapshot_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     return {"status": "deleted"}
 
 
@@ -955,10 +1136,9 @@ async def explain_blocked_defenses(req: ExplanationExplainRequest):
     for richer explanations with combined_explanation and resource_summary.
     """
     service = get_explanation_service()
-    session_mgr = get_session_manager()
 
     # Ensure session exists
-    session_mgr.get_or_create(req.session_id, req.dataset_id)
+    session_manager.get_or_create(req.session_id, req.dataset_id)
 
     config = ExplanationConfig(
         mcs_timeout_sec=req.mcs_timeout_sec,
@@ -983,7 +1163,7 @@ async def explain_blocked_defenses(req: ExplanationExplainRequest):
         )
         try:
             result = await loop.run_in_executor(
-                None,
+                solver_pool,
                 lambda: service.explain_via_driver(
                     dataset_id=req.dataset_id,
                     blocked_defense_ids=req.blocked_defense_ids,
@@ -1002,7 +1182,7 @@ async def explain_blocked_defenses(req: ExplanationExplainRequest):
             # Fallback to existing implementation if driver fails
             logger.warning(f"Driver explanation failed, falling back: {e}")
             result = await loop.run_in_executor(
-                None,
+                solver_pool,
                 lambda: service.explain_blocked_defenses(
                     dataset_id=req.dataset_id,
                     blocked_defense_ids=req.blocked_defense_ids,
@@ -1013,7 +1193,7 @@ async def explain_blocked_defenses(req: ExplanationExplainRequest):
             )
     else:
         result = await loop.run_in_executor(
-            None,
+            solver_pool,
             lambda: service.explain_blocked_defenses(
                 dataset_id=req.dataset_id,
                 blocked_defense_ids=req.blocked_defense_ids,
@@ -1024,9 +1204,12 @@ async def explain_blocked_defenses(req: ExplanationExplainRequest):
         )
 
     # Store result in session
-    session_mgr.store_explanation(req.session_id, result)
+    session_manager.store_explanation(req.session_id, result)
 
-    return result
+    # response_model stays for the schema, but returning the model would make
+    # FastAPI dump it and re-validate the dump; orjson handles the int-keyed
+    # perDefenseRepairs directly.
+    return ORJSONResponse(result.model_dump(by_alias=True))
 
 
 @app.post("/api/explanations/explain/stream")
@@ -1180,8 +1363,7 @@ async def explain_blocked_defenses_stream(req: ExplanationExplainRequest):
         if result_holder["error"]:
             yield _sse_event("error", {"message": result_holder["error"]})
         elif result_holder["result"]:
-            session_mgr = get_session_manager()
-            session_mgr.store_explanation(req.session_id, result_holder["result"])
+            session_manager.store_explanation(req.session_id, result_holder["result"])
             yield _sse_event("result", result_holder["result"].model_dump(by_alias=True))
         else:
             yield _sse_event("error", {"message": "No result produced"})
@@ -1332,8 +1514,7 @@ async def explain_single_defense_stream(req: ExplainSingleDefenseRequest):
         if result_holder["error"]:
             yield _sse_event("error", {"message": result_holder["error"]})
         elif result_holder["result"]:
-            session_mgr = get_session_manager()
-            session_mgr.store_explanation(req.session_id, result_holder["result"])
+            session_manager.store_explanation(req.session_id, result_holder["result"])
             yield _sse_event("result", result_holder["result"].model_dump(by_alias=True))
         else:
             yield _sse_event("error", {"message": "No result produced"})
@@ -1380,10 +1561,9 @@ async def get_legal_slots(
     Used for drag-and-drop operations in the UI.
     """
     service = get_explanation_service()
-    session_mgr = get_session_manager()
 
     # Get planned defenses from session
-    session = session_mgr.get(session_id)
+    session = session_manager.get(session_id)
     planned_defense_ids = session.planned_defense_ids if session else []
 
     loop = asyncio.get_event_loop()
@@ -1411,10 +1591,9 @@ async def analyze_bottlenecks(
     and timeslots with high demand relative to room capacity.
     """
     service = get_explanation_service()
-    session_mgr = get_session_manager()
 
     # Get planned defenses from session
-    session = session_mgr.get(session_id)
+    session = session_manager.get(session_id)
     planned_defense_ids = session.planned_defense_ids if session else []
 
     loop = asyncio.get_event_loop()
@@ -1588,15 +1767,14 @@ def stage_relaxation(req: StageRelaxationRequest):
 
     The relaxation is validated and stored in the session.
     """
-    session_mgr = get_session_manager()
 
     try:
-        session_mgr.get_or_create(req.session_id, "")  # Ensure session exists
-        session_mgr.stage_relaxation(req.session_id, req.relaxation)
+        session_manager.get_or_create(req.session_id, "")  # Ensure session exists
+        session_manager.stage_relaxation(req.session_id, req.relaxation)
     except KeyError:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return session_mgr.get_staged_response(req.session_id)
+    return session_manager.get_staged_response(req.session_id)
 
 
 @app.get("/api/session/staged-relaxations/{session_id}", response_model=StagedRelaxationsResponse)
@@ -1604,8 +1782,7 @@ def get_staged_relaxations(session_id: str):
     """
     Get all staged relaxations for a session.
     """
-    session_mgr = get_session_manager()
-    return session_mgr.get_staged_response(session_id)
+    return session_manager.get_staged_response(session_id)
 
 
 @app.delete("/api/session/staged-relaxations/{session_id}/{relaxation_id}")
@@ -1613,8 +1790,7 @@ def unstage_relaxation(session_id: str, relaxation_id: str):
     """
     Remove a relaxation from staging.
     """
-    session_mgr = get_session_manager()
-    success = session_mgr.unstage_relaxation(session_id, relaxation_id)
+    success = session_manager.unstage_relaxation(session_id, relaxation_id)
     if not success:
         raise HTTPException(status_code=404, detail="Relaxation not found")
     return {"status": "removed", "relaxation_id": relaxation_id}
@@ -1627,8 +1803,7 @@ def validate_staged_relaxations(session_id: str):
 
     Checks for valid relaxation types, non-empty targets, and no conflicts.
     """
-    session_mgr = get_session_manager()
-    return session_mgr.validate_staged(session_id)
+    return session_manager.validate_staged(session_id)
 
 
 @app.delete("/api/session/staged-relaxations/{session_id}")
@@ -1636,22 +1811,21 @@ def clear_staged_relaxations(session_id: str):
     """
     Clear all staged relaxations for a session.
     """
-    session_mgr = get_session_manager()
-    success = session_mgr.clear_session(session_id)
+    success = session_manager.clear_session(session_id)
     if not success:
         raise HTTPException(status_code=404, detail="Session not found")
     return {"status": "cleared", "session_id": session_id}
 
 
 @app.post("/api/session/{session_id}/planned-defenses")
-def update_planned_defenses(session_id: str, planned_defense_ids: list[int] = Body(...)):
+def update_planned_defenses(session_id: str, req: PlannedDefensesRequest):
     """
     Update the list of planned defense IDs for a session.
 
     This is used to track which defenses are already scheduled
     for legal slot computation and bottleneck analysis.
     """
-    session_mgr = get_session_manager()
-    session_mgr.get_or_create(session_id, "")  # Ensure session exists
-    session_mgr.update_planned_defenses(session_id, planned_defense_ids)
+    planned_defense_ids = req.planned_defense_ids
+    session_manager.get_or_create(session_id, "")  # Ensure session exists
+    session_manager.update_planned_defenses(session_id, planned_defense_ids)
     return {"status": "updated", "session_id": session_id, "count": len(planned_defense_ids)}
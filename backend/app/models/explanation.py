@@ -10,7 +10,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 
 # -----------------------------------------------------------------------------
@@ -52,6 +52,8 @@ class RelaxationType(str, Enum):
 
 class SlotRef(BaseModel):
     """Reference to a specific timeslot."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     timestamp: str = Field(..., description="ISO datetime string")
     slot_index: Optional[int] = Field(None, description="Integer slot index")
 
@@ -62,6 +64,8 @@ class ConstraintGroup(BaseModel):
 
     Represents a semantic unit like "person X is unavailable at time Y".
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     category: str = Field(..., description="Constraint category")
     entity: str = Field(..., description="Entity name (person, room, etc.)")
     entity_type: str = Field(..., description="Type of entity")
@@ -314,6 +318,8 @@ class ApplyRepairsAndResolveResponse(BaseModel):
 
 class LegalSlot(BaseModel):
     """A legal timeslot for scheduling a defense."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     slot_index: int
     timestamp: str = Field(..., description="ISO datetime string")
     room_ids: List[str] = Field(
@@ -351,6 +357,8 @@ class LegalSlotsResponse(BaseModel):
 
 class PersonBottleneck(BaseModel):
     """A person with insufficient available timeslots."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     person_name: str
     required_slots: int = Field(..., description="Defenses they must attend")
     available_slots: int = Field(..., description="Legal slots after unavailabilities")
@@ -360,6 +368,8 @@ class PersonBottleneck(BaseModel):
 
 class SlotBottleneck(BaseModel):
     """A timeslot with high demand relative to capacity."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     slot_index: int
     timestamp: str
     demand: int = Field(..., description="Defenses competing for this slot")
@@ -392,6 +402,8 @@ class BottleneckAnalysis(BaseModel):
 
 class RelaxationTarget(BaseModel):
     """Target specification for a relaxation action."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     entity: str
     entity_type: str
     slots: List[str] = Field(default_factory=list)
@@ -423,6 +435,21 @@ class StageRelaxationRequest(BaseModel):
     relaxation: RelaxationAction
 
 
+class PlannedDefensesRequest(BaseModel):
+    """Request to replace a session's planned defense IDs."""
+    model_config = ConfigDict(extra="forbid")
+
+    planned_defense_ids: List[int] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_bare_list(cls, value: Any) -> Any:
+        # Older clients post the ID array directly as the request body
+        if isinstance(value, list):
+            return {"planned_defense_ids": value}
+        return value
+
+
 class StagedRelaxationsResponse(BaseModel):
     """Response with all staged relaxations for a session."""
     session_id: str
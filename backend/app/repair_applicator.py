@@ -8,14 +8,23 @@ and modifies a copy of the dataset files accordingly.
 from __future__ import annotations
 
 import csv
-import json
+import functools
 import logging
+import os
 import re
 import shutil
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from .config import DATA_INPUT_DIR
+from .json_utils import read_json
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +33,87 @@ logger = logging.getLogger(__name__)
 DRIVER_INPUT_DIR = Path(__file__).parent.parent.parent / "Defense-rostering" / "input_data"
 
 
-def _parse_angle_brackets(text: str) -> list[str]:
-    """Extract all <...> parts from a string. Returns strings without brackets."""
-    return re.findall(r"<([^>]+)>", text)
+_ANGLE_RE = re.compile(r"<([^>]+)>")
+_REPAIR_VERB_RE = re.compile(r"[\w-]+")
+_REPAIRED_SUFFIX_RE = re.compile(r"(_repaired)+$")
+_ROOM_ID_RE = re.compile(r"[^a-z0-9]+")
+
+# unavailabilities.csv columns read by the person-unavailable repair
+_UNAVAIL_FIELDS = ("name", "day", "start_time", "end_time")
+
+
+# ioctl request number for a copy-on-write clone (Linux FICLONE)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """``copytree`` copy function that reflinks where the filesystem supports it.
+
+    On btrfs/XFS the clone shares blocks with ``src`` until either side is
+    written, so copying a large dataset costs no data I/O. Anywhere else it
+    falls back to ``shutil.copy2``.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _sync_tree(src: Path, dst: Path) -> None:
+    """Make ``dst`` mirror ``src``, copying only files whose size or mtime differ.
+
+    Copies keep their source mtime (copystat), so files a repair left
+    untouched match on the next sync and are skipped.
+    """
+    if not dst.is_dir():
+        if dst.exists():
+            dst.unlink()
+        shutil.copytree(src, dst, copy_function=_clone_file)
+        return
+
+    src_entries = {entry.name: entry for entry in os.scandir(src)}
+    for entry in os.scandir(dst):
+        if entry.name not in src_entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    for name, entry in src_entries.items():
+        target = dst / name
+        if entry.is_dir():
+            _sync_tree(Path(entry.path), target)
+            continue
+        src_stat = entry.stat()
+        try:
+            dst_stat = target.stat()
+        except FileNotFoundError:
+            dst_stat = None
+        if (
+            dst_stat is not None
+            and dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            continue
+        if target.is_dir():
+            shutil.rmtree(target)
+        _clone_file(entry.path, str(target))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_repair(repair: str) -> tuple[str, tuple[str, ...]]:
+    """Split a repair string into its verb and its <...> arguments (without brackets).
+
+    "person-unavailable <Jesse Davis> <2026-01-01 10:00:00>"
+    -> ("person-unavailable", ("Jesse Davis", "2026-01-01 10:00:00"))
+    """
+    verb = _REPAIR_VERB_RE.match(repair)
+    return (verb.group() if verb else ""), tuple(_ANGLE_RE.findall(repair))
 
 
 def apply_repairs(dataset_name: str, repair_strings: list[str]) -> Path:
@@ -48,29 +135,24 @@ def apply_repairs(dataset_name: str, repair_strings: list[str]) -> Path:
 
     # Strip any existing _repaired suffixes to avoid cascading names
     # e.g. "foo_repaired_repaired" → "foo_repaired"
-    base_name = re.sub(r"(_repaired)+$", "", dataset_name)
+    base_name = _REPAIRED_SUFFIX_RE.sub("", dataset_name)
     repaired_dir = DATA_INPUT_DIR / f"{base_name}_repaired"
 
     # Clean and copy
     if repaired_dir.exists():
         shutil.rmtree(repaired_dir)
-    shutil.copytree(original_dir, repaired_dir)
+    shutil.copytree(original_dir, repaired_dir, copy_function=_clone_file)
 
-    # Apply each repair
+    # Apply every repair in memory, then write each touched file once
+    files = _DatasetFiles(repaired_dir)
     for repair in repair_strings:
-        if repair.startswith("extra-day"):
-            _apply_extra_day(repaired_dir)
-        elif repair.startswith("extra-room"):
-            parts = _parse_angle_brackets(repair)
-            if not parts:
-                raise ValueError(f"Invalid extra-room repair (no room name): {repair}")
-            _apply_extra_room(repaired_dir, parts[0])
-        elif repair.startswith("person-unavailable"):
-            _apply_person_unavailable(repaired_dir, repair)
-        elif repair.startswith("enable-room"):
-            _apply_enable_room(repaired_dir, repair)
-        else:
+        verb, args = _parse_repair(repair)
+        handler = _REPAIR_HANDLERS.get(verb)
+        if handler is None:
             logger.warning("Unknown repair action, skipping: %s", repair)
+            continue
+        handler(files, repair, args)
+    files.flush()
 
     logger.info(
         "Applied %d repairs to dataset '%s' -> '%s'",
@@ -82,33 +164,82 @@ def apply_repairs(dataset_name: str, repair_strings: list[str]) -> Path:
     # Also sync repaired dataset to CLI driver directory so subsequent
     # explanation runs (on the repaired dataset) see the correct data.
     driver_repaired = DRIVER_INPUT_DIR / repaired_dir.name
-    if driver_repaired.exists():
-        shutil.rmtree(driver_repaired)
-    shutil.copytree(repaired_dir, driver_repaired)
+    _sync_tree(repaired_dir, driver_repaired)
     logger.info("Synced repaired dataset to driver dir: %s", driver_repaired)
 
     return repaired_dir
 
 
-def _apply_extra_day(repaired_dir: Path) -> None:
+class _DatasetFiles:
+    """Dataset files loaded on first use; ``flush`` writes back only the changed ones."""
+
+    def __init__(self, dataset_dir: Path) -> None:
+        self.dataset_dir = dataset_dir
+        self._json: dict[str, dict] = {}
+        self._dirty_json: set[str] = set()
+        self._unavail_header: list[str] = []
+        self._unavail_rows: list[list[str]] | None = None
+        self._unavail_dirty = False
+
+    def json(self, name: str) -> dict:
+        data = self._json.get(name)
+        if data is None:
+            data = self._json[name] = read_json(self.dataset_dir / name)
+        return data
+
+    def mark_changed(self, name: str) -> None:
+        self._dirty_json.add(name)
+
+    @property
+    def unavailabilities(self) -> list[list[str]]:
+        """Raw CSV rows (header excluded); index them with ``unavailability_fields``."""
+        if self._unavail_rows is None:
+            with open(self.dataset_dir / "unavailabilities.csv", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                self._unavail_header = next(reader, [])
+                self._unavail_rows = [row for row in reader if row]
+        return self._unavail_rows
+
+    @unavailabilities.setter
+    def unavailabilities(self, rows: list[list[str]]) -> None:
+        self._unavail_rows = rows
+        self._unavail_dirty = True
+
+    @property
+    def unavailability_fields(self) -> tuple[int, ...]:
+        """Column indices of name, day, start_time and end_time."""
+        header = self._unavail_header
+        return tuple(header.index(col) for col in _UNAVAIL_FIELDS)
+
+    def flush(self) -> None:
+        for name in self._dirty_json:
+            (self.dataset_dir / name).write_bytes(orjson.dumps(self._json[name], option=orjson.OPT_INDENT_2))
+        if self._unavail_dirty:
+            with open(self.dataset_dir / "unavailabilities.csv", "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(self._unavail_header)
+                writer.writerows(self._unavail_rows)
+
+
+def _apply_extra_day(files: _DatasetFiles, repair: str, args: tuple[str, ...]) -> None:
     """Increment number_of_days in timeslot_info.json by 1."""
-    path = repaired_dir / "timeslot_info.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
+    data = files.json("timeslot_info.json")
     data["number_of_days"] = data.get("number_of_days", 1) + 1
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    files.mark_changed("timeslot_info.json")
 
     logger.debug("extra-day: number_of_days now %d", data["number_of_days"])
 
 
-def _apply_extra_room(repaired_dir: Path, room: str) -> None:
+def _apply_extra_room_repair(files: _DatasetFiles, repair: str, args: tuple[str, ...]) -> None:
+    """Add the room named by "extra-room <Room Name>"."""
+    if not args:
+        raise ValueError(f"Invalid extra-room repair (no room name): {repair}")
+    _apply_extra_room(files, args[0])
+
+
+def _apply_extra_room(files: _DatasetFiles, room: str) -> None:
     """Add a new room name to rooms.json."""
-    path = repaired_dir / "rooms.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = files.json("rooms.json")
 
     if "rooms" not in data or not isinstance(data["rooms"], list):
         raise ValueError("rooms.json has unexpected structure")
@@ -118,112 +249,148 @@ def _apply_extra_room(repaired_dir: Path, room: str) -> None:
         (r.get("name", r) if isinstance(r, dict) else r)
         for r in data["rooms"]
     }
-    if room not in existing_names:
-        room_id = re.sub(r'[^a-z0-9]+', '-', room.lower().strip()).strip('-')
-        data["rooms"].append({
-            "id": room_id or f"room-{len(data['rooms']) + 1}",
-            "name": room,
-            "enabled": True,
-        })
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if room in existing_names:
+        logger.debug("extra-room: '%s' already exists, skipping", room)
+        return
+
+    room_id = _ROOM_ID_RE.sub('-', room.lower().strip()).strip('-')
+    data["rooms"].append({
+        "id": room_id or f"room-{len(data['rooms']) + 1}",
+        "name": room,
+        "enabled": True,
+    })
+    files.mark_changed("rooms.json")
 
     logger.debug("extra-room: added '%s'", room)
 
 
-def _apply_enable_room(repaired_dir: Path, repair: str) -> None:
+def _apply_enable_room(files: _DatasetFiles, repair: str, args: tuple[str, ...]) -> None:
     """
     Enable a disabled room by setting enabled=true in rooms.json.
 
     Repair format: "enable-room <Room Name>"
     """
-    parts = _parse_angle_brackets(repair)
-    if len(parts) != 1:
+    if len(args) != 1:
         raise ValueError(f"Invalid enable-room repair: {repair}")
 
-    room_name = parts[0]
-    path = repaired_dir / "rooms.json"
-
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    room_name = args[0]
+    data = files.json("rooms.json")
 
     for room in data.get("rooms", []):
         if isinstance(room, dict) and room.get("name") == room_name:
-            room["enabled"] = True
+            if room.get("enabled") is not True:
+                room["enabled"] = True
+                files.mark_changed("rooms.json")
             break
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-
     logger.debug("enable-room: enabled '%s'", room_name)
 
 
-def _apply_person_unavailable(repaired_dir: Path, repair: str) -> None:
+@functools.lru_cache(maxsize=4096)
+def _parse_repair_datetime(value: str) -> datetime:
+    """Parse a repair's "YYYY-MM-DD HH:MM:SS" target.
+
+    Every solve re-applies the dataset's active repairs, so the same strings
+    come back each time; datetimes are immutable and safe to share.
     """
-    Remove a person's unavailability for a specific hour from unavailabilities.csv.
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
 
-    Repair format: "person-unavailable <Person Name> <YYYY-MM-DD HH:MM:SS>"
 
-    If the unavailability row spans multiple hours, it is split around
-    the target hour so that adjacent hours remain unavailable.
-    """
-    parts = _parse_angle_brackets(repair)
-    if len(parts) != 2:
-        raise ValueError(f"Invalid person-unavailable repair: {repair}")
+def _minute_of_day(value: str) -> int:
+    """Parse "HH:MM" into minutes since midnight."""
+    hours, _, minutes = value.partition(":")
+    return int(hours) * 60 + int(minutes)
+
 
-    person, datetime_str = parts
-    target_dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-    one_hour = timedelta(hours=1)
+def _format_minute(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
 
-    csv_path = repaired_dir / "unavailabilities.csv"
 
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        rows = list(reader)
+def _split_unavailability(
+    rows: list,
+    person: str,
+    target_dt: datetime,
+    fields: tuple = _UNAVAIL_FIELDS,
+) -> list:
+    """Return ``rows`` with the hour starting at ``target_dt`` freed for ``person``.
 
-    new_rows = []
+    ``rows`` are dicts or raw CSV lists; ``fields`` gives the keys (or
+    column indices) of name, day, start_time and end_time.
 
+    Rows for other people or days pass through untouched; an overlapping
+    row is split around the removed hour so adjacent hours stay blocked.
+    When no row overlaps, ``rows`` itself is returned.
+    """
+    name_key, day_key, start_key, end_key = fields
+    # Compare minute-of-day ints; every row reaching the interval test is on target_day
+    repair_start = target_dt.hour * 60 + target_dt.minute
+    repair_end = repair_start + 60
+    target_day = target_dt.strftime("%Y-%m-%d")
+
+    new_rows: list = []
+    append = new_rows.append
+    changed = False
     for row in rows:
-        if row["name"] != person or row["day"] != target_dt.strftime("%Y-%m-%d"):
-            new_rows.append(row)
+        if row[name_key] != person or row[day_key] != target_day:
+            append(row)
             continue
 
-        start_dt = datetime.strptime(f'{row["day"]} {row["start_time"]}', "%Y-%m-%d %H:%M")
-        end_dt = datetime.strptime(f'{row["day"]} {row["end_time"]}', "%Y-%m-%d %H:%M")
+        start = _minute_of_day(row[start_key])
+        end = _minute_of_day(row[end_key])
 
-        repair_start = target_dt
-        repair_end = target_dt + one_hour
-
-        if repair_end <= start_dt or repair_start >= end_dt:
+        if repair_end <= start or repair_start >= end:
             # No overlap — keep row as-is
-            new_rows.append(row)
+            append(row)
             continue
 
         # Split existing segment around the removed hour
-        if start_dt < repair_start:
-            new_rows.append({
-                **row,
-                "start_time": start_dt.strftime("%H:%M"),
-                "end_time": repair_start.strftime("%H:%M"),
-            })
-
-        if repair_end < end_dt:
-            new_rows.append({
-                **row,
-                "start_time": repair_end.strftime("%H:%M"),
-                "end_time": end_dt.strftime("%H:%M"),
-            })
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(new_rows)
+        changed = True
+        if start < repair_start:
+            before = row.copy()
+            before[start_key] = _format_minute(start)
+            before[end_key] = _format_minute(repair_start)
+            append(before)
+
+        if repair_end < end:
+            after = row.copy()
+            after[start_key] = _format_minute(repair_end)
+            after[end_key] = _format_minute(end)
+            append(after)
+
+    return new_rows if changed else rows
+
+
+def _apply_person_unavailable(files: _DatasetFiles, repair: str, args: tuple[str, ...]) -> None:
+    """
+    Remove a person's unavailability for a specific hour from unavailabilities.csv.
+
+    Repair format: "person-unavailable <Person Name> <YYYY-MM-DD HH:MM:SS>"
+
+    If the unavailability row spans multiple hours, it is split around
+    the target hour so that adjacent hours remain unavailable.
+    """
+    if len(args) != 2:
+        raise ValueError(f"Invalid person-unavailable repair: {repair}")
+
+    person, datetime_str = args
+    target_dt = _parse_repair_datetime(datetime_str)
+    rows = files.unavailabilities
+    new_rows = _split_unavailability(rows, person, target_dt, files.unavailability_fields)
+    if new_rows is not rows:
+        files.unavailabilities = new_rows
 
     logger.debug("person-unavailable: removed %s at %s", person, datetime_str)
 
 
+# Repair verb -> file-based handler
+_REPAIR_HANDLERS = {
+    "extra-day": _apply_extra_day,
+    "extra-room": _apply_extra_room_repair,
+    "person-unavailable": _apply_person_unavailable,
+    "enable-room": _apply_enable_room,
+}
+
+
 ACTIVE_REPAIRS_FILE = "active_repairs.json"
 
 
@@ -236,9 +403,9 @@ def load_active_repairs(dataset_name: str) -> list[str]:
     if not path.exists():
         return []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = orjson.loads(path.read_bytes())
         return data.get("repairs", [])
-    except (json.JSONDecodeError, OSError) as exc:
+    except (orjson.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to read %s: %s", path, exc)
         return []
 
@@ -252,8 +419,8 @@ def load_active_repairs_full(dataset_name: str) -> dict:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as exc:
+        return orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to read %s: %s", path, exc)
         return {}
 
@@ -275,11 +442,12 @@ def save_active_repairs(
     path = dataset_dir / ACTIVE_REPAIRS_FILE
     data: dict = {
         "repairs": repair_strings,
-        "applied_at": datetime.utcnow().isoformat() + "Z",
+        # orjson renders the aware datetime as ISO-8601 with a trailing "Z"
+        "applied_at": datetime.now(timezone.utc),
     }
     if display:
         data["display"] = display
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z))
     logger.info("Saved %d active repairs for dataset '%s'", len(repair_strings), dataset_name)
 
 
@@ -300,64 +468,32 @@ def apply_repairs_to_data(
 ) -> tuple[list[dict[str, str]], dict]:
     """Apply repair strings to **in-memory** data structures (non-destructive).
 
-    Uses the same robust interval-overlap matching as the file-based
+    Shares ``_split_unavailability`` with the file-based
     ``_apply_person_unavailable`` function, but operates on lists/dicts
     rather than CSV/JSON files.
 
     Returns the modified ``(unavailabilities, rooms)`` tuple.
     """
-    one_hour = timedelta(hours=1)
+    # (person, day) -> target hours, in repair order; applied in one pass below
+    freed_hours: dict[tuple[str, str], list[datetime]] = {}
+    # Runs on every solve; check the level once rather than per repair
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     for repair in repair_strings:
-        if repair.startswith("person-unavailable"):
-            parts = _parse_angle_brackets(repair)
+        verb, parts = _parse_repair(repair)
+        if verb == "person-unavailable":
             if len(parts) != 2:
                 logger.warning("Invalid person-unavailable repair, skipping: %s", repair)
                 continue
             person, datetime_str = parts
             # Handle both "YYYY-MM-DD HH:MM:SS" and "YYYY-MM-DDTHH:MM:SS"
             datetime_str = datetime_str.replace("T", " ")
-            target_dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-            repair_start = target_dt
-            repair_end = target_dt + one_hour
-            target_day = target_dt.strftime("%Y-%m-%d")
-
-            new_unavail: list[dict[str, str]] = []
-            for entry in unavailabilities:
-                if entry.get("name") != person or entry.get("day") != target_day:
-                    new_unavail.append(entry)
-                    continue
-
-                start_dt = datetime.strptime(
-                    f'{entry["day"]} {entry["start_time"]}', "%Y-%m-%d %H:%M"
-                )
-                end_dt = datetime.strptime(
-                    f'{entry["day"]} {entry["end_time"]}', "%Y-%m-%d %H:%M"
-                )
-
-                if repair_end <= start_dt or repair_start >= end_dt:
-                    new_unavail.append(entry)
-                    continue
-
-                # Split around removed hour
-                if start_dt < repair_start:
-                    new_unavail.append({
-                        **entry,
-                        "start_time": start_dt.strftime("%H:%M"),
-                        "end_time": repair_start.strftime("%H:%M"),
-                    })
-                if repair_end < end_dt:
-                    new_unavail.append({
-                        **entry,
-                        "start_time": repair_end.strftime("%H:%M"),
-                        "end_time": end_dt.strftime("%H:%M"),
-                    })
-
-            unavailabilities = new_unavail
-            logger.debug("active_repair: removed %s at %s", person, datetime_str)
-
-        elif repair.startswith("enable-room"):
-            parts = _parse_angle_brackets(repair)
+            target_dt = _parse_repair_datetime(datetime_str)
+            freed_hours.setdefault((person, target_dt.strftime("%Y-%m-%d")), []).append(target_dt)
+            if debug:
+                logger.debug("active_repair: removed %s at %s", person, datetime_str)
+
+        elif verb == "enable-room":
             if not parts:
                 continue
             room_name = parts[0]
@@ -365,10 +501,10 @@ def apply_repairs_to_data(
                 if isinstance(room, dict) and room.get("name") == room_name:
                     room["enabled"] = True
                     break
-            logger.debug("active_repair: enabled room '%s'", room_name)
+            if debug:
+                logger.debug("active_repair: enabled room '%s'", room_name)
 
-        elif repair.startswith("extra-room"):
-            parts = _parse_angle_brackets(repair)
+        elif verb == "extra-room":
             if not parts:
                 continue
             room_name = parts[0]
@@ -378,15 +514,40 @@ def apply_repairs_to_data(
                 for r in rooms_list
             }
             if room_name not in existing:
-                room_id = re.sub(r'[^a-z0-9]+', '-', room_name.lower().strip()).strip('-')
+                room_id = _ROOM_ID_RE.sub('-', room_name.lower().strip()).strip('-')
                 rooms_list.append({
                     "id": room_id or f"room-{len(rooms_list) + 1}",
                     "name": room_name,
                     "enabled": True,
                 })
-            logger.debug("active_repair: added room '%s'", room_name)
+            if debug:
+                logger.debug("active_repair: added room '%s'", room_name)
 
         else:
             logger.warning("Unknown active repair, skipping: %s", repair)
 
+    if freed_hours:
+        # Splits of one row only ever yield pieces of that row, so applying a
+        # (person, day)'s repairs row by row matches rebuilding the whole list
+        # once per repair, without touching unrelated rows R times.
+        # Most rows belong to people without repairs; a set probe on the name
+        # skips building the (name, day) key for them.
+        freed_people = {person for person, _day in freed_hours}
+        new_unavail: list[dict[str, str]] = []
+        append = new_unavail.append
+        for entry in unavailabilities:
+            person = entry.get("name")
+            if person not in freed_people:
+                append(entry)
+                continue
+            targets = freed_hours.get((person, entry.get("day")))
+            if not targets:
+                append(entry)
+                continue
+            pieces = [entry]
+            for target_dt in targets:
+                pieces = _split_unavailability(pieces, person, target_dt)
+            new_unavail.extend(pieces)
+        unavailabilities = new_unavail
+
     return unavailabilities, rooms
@@ -1,86 +1,116 @@
 from __future__ import annotations
 
+import functools
 import itertools
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import Any, Dict, List, Tuple
 
 from . import datasets
 
 
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-", "|": "-", ".": "-"})
+
+
+# Supervisors and assessors recur across many defence rows
+@functools.lru_cache(maxsize=4096)
 def slugify(value: str) -> str:
-    return (
-        value.lower()
-        .replace(" ", "-")
-        .replace("/", "-")
-        .replace("|", "-")
-        .replace(".", "-")
-    )
+    return value.lower().translate(_SLUG_TABLE)
+
+
+# "HH:00" labels; index 24 wraps to midnight for a slot ending at the end of the day
+_HOUR_LABELS = [f"{hour % 24:02d}:00" for hour in range(25)]
 
 
 def _build_timeslots(info: Dict) -> List[Dict]:
-    first_day = datetime.fromisoformat(info["first_day"])
+    first_ordinal = datetime.fromisoformat(info["first_day"]).toordinal()
     n_days = int(info["number_of_days"])
     start_hour = int(info["start_hour"])
     end_hour = int(info["end_hour"])
-    slots = []
-    idx = 0
+    hours = range(start_hour, end_hour)
+    if hours and (start_hour < 0 or end_hour > 24):
+        raise ValueError("hour must be in 0..23")
+    days = []
     for day in range(n_days):
-        day_dt = first_day + timedelta(days=day)
-        for hour in range(start_hour, end_hour):
-            start_dt = day_dt.replace(hour=hour, minute=0)
-            end_dt = start_dt + timedelta(hours=1)
-            slots.append(
-                {
-                    "timeslot_id": f"ts-{idx}",
-                    "date": start_dt.date().isoformat(),
-                    "day_name": start_dt.strftime("%A"),
-                    "start_time": start_dt.strftime("%H:%M"),
-                    "end_time": end_dt.strftime("%H:%M"),
-                    "is_restricted": False,
-                    "day_index": day,
-                    "slot_index": idx,
-                    "start_offset": idx,
-                }
-            )
-            idx += 1
+        day_date = date.fromordinal(first_ordinal + day)
+        days.append((day, day_date.isoformat(), day_date.strftime("%A")))
+    slots = [
+        {
+            "timeslot_id": f"ts-{idx}",
+            "date": date_iso,
+            "day_name": day_name,
+            "start_time": _HOUR_LABELS[hour],
+            "end_time": _HOUR_LABELS[hour + 1],
+            "is_restricted": False,
+            "day_index": day,
+            "slot_index": idx,
+            "start_offset": idx,
+        }
+        for idx, ((day, date_iso, day_name), hour) in enumerate(itertools.product(days, hours))
+    ]
     return slots
 
 
-def _unique_participants(defences: List[Dict[str, str]]) -> Dict[str, Dict]:
+_PARTICIPANT_COLUMNS = (
+    "student",
+    "supervisor",
+    "co_supervisor",
+    "assessor1",
+    "assessor2",
+    "mentor1",
+    "mentor2",
+    "mentor3",
+    "mentor4",
+)
+
+
+def _unique_participants(defences: List[Dict[str, str]]) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """Collect participants keyed by slug; also return the name -> slug map built on the way."""
     participants = {}
-    columns = [
-        "student",
-        "supervisor",
-        "co_supervisor",
-        "assessor1",
-        "assessor2",
-        "mentor1",
-        "mentor2",
-        "mentor3",
-        "mentor4",
-    ]
+    name_to_pid: Dict[str, str] = {}
     for row in defences:
-        for col in columns:
+        entity_id = row.get("title") or row.get("student", "")
+        for col in _PARTICIPANT_COLUMNS:
+            # csv rows hold str (or None for short rows), so no str() needed
             name = row.get(col)
-            if not name or str(name).strip() == "":
+            if not name or name.isspace():
                 continue
-            pid = slugify(name)
+            pid = name_to_pid.get(name)
+            if pid is None:
+                pid = name_to_pid[name] = slugify(name)
             participants.setdefault(
                 pid,
                 {
                     "participant_id": pid,
                     "name": name,
-                    "entity_ids": set(),
+                    "entity_ids": {},
                 },
             )
-            participants[pid]["entity_ids"].add(row.get("title") or row.get("student", ""))
-    # convert set to list
+            # dict as an ordered set; participants usually sit on only a few defences
+            participants[pid]["entity_ids"][entity_id] = None
     for info in participants.values():
-        info["entity_ids"] = sorted(list(info["entity_ids"]))
-    return participants
+        info["entity_ids"] = sorted(info["entity_ids"])
+    return participants, name_to_pid
+
+
+# dataset name -> (dataset signature, payload)
+_PAYLOAD_CACHE: Dict[str, Tuple[tuple, Dict]] = {}
 
 
 def build_schedule_payload(dataset_name: str) -> Dict:
+    """Build the schedule payload for a dataset, reusing it while the dataset is unchanged.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    signature = datasets.dataset_signature(dataset_name)
+    cached = _PAYLOAD_CACHE.get(dataset_name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    payload = _build_schedule_payload(dataset_name)
+    _PAYLOAD_CACHE[dataset_name] = (signature, payload)
+    return payload
+
+
+def _build_schedule_payload(dataset_name: str) -> Dict:
     defences, unavail, rooms, timeslot_info = datasets.load_dataset(dataset_name)
     metadata = {}
     try:
@@ -89,15 +119,16 @@ def build_schedule_payload(dataset_name: str) -> Dict:
         metadata = {"name": dataset_name}
     timeslots = _build_timeslots(timeslot_info)
     entities = []
-    participants = _unique_participants(defences)
+    participants, name_to_pid = _unique_participants(defences)
     for idx, row in enumerate(defences):
         entity_id = str(row.get("defense_id") or f"def-{idx+1}")
         title = row.get("title") or row.get("student") or f"Defense {idx+1}"
+        owner = row.get("student", title)
         entities.append(
             {
                 "entity_id": entity_id,
                 "name": title,
-                "owner_id": slugify(row.get("student", title)),
+                "owner_id": name_to_pid.get(owner) or slugify(owner),
                 "raw": row,
             }
         )
@@ -117,7 +148,6 @@ def build_schedule_payload(dataset_name: str) -> Dict:
                 "resource_id": f"room-{resource_idx+1}",
                 "name": name,
                 "max_capacity": capacity,
-                "raw": room,
             }
         )
         resource_idx += 1
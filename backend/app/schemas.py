@@ -8,10 +8,12 @@ from pydantic import BaseModel, Field, ConfigDict
 class ScheduleData(BaseModel):
     model_config = ConfigDict(extra="allow")
     dataset_id: str = Field(..., description="Dataset identifier")
-    entities: List[Dict[str, Any]] = Field(default_factory=list)
-    resources: List[Dict[str, Any]] = Field(default_factory=list)
-    timeslots: List[Dict[str, Any]] = Field(default_factory=list)
-    participants: List[Dict[str, Any]] = Field(default_factory=list)
+    # Row shapes are deliberately loose and these lists are the bulk of every
+    # solve request; List[Any] skips validating each row as a dict.
+    entities: List[Any] = Field(default_factory=list)
+    resources: List[Any] = Field(default_factory=list)
+    timeslots: List[Any] = Field(default_factory=list)
+    participants: List[Any] = Field(default_factory=list)
     max_entities_per_resource: Optional[int] = None
     max_entities_per_timeslot: Optional[int] = None
     resource_capacity: Optional[int] = None
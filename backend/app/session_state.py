@@ -7,13 +7,14 @@ including staged relaxations pending application.
 
 from __future__ import annotations
 
+import heapq
 import logging
 import threading
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .models.explanation import (
     RelaxationAction,
@@ -26,28 +27,99 @@ from .models.explanation import (
 
 logger = logging.getLogger("uvicorn.error")
 
+# Number of striped session locks; must be a power of two
+_LOCK_STRIPES = 16
 
-@dataclass
+# Minimum seconds between last-accessed updates; negligible against the TTL
+_TOUCH_INTERVAL = 5.0
+
+
+def _impact_key(relax: RelaxationAction) -> str:
+    """Key under which a relaxation counts toward the estimated impact."""
+    return f"{relax.type.value}:{relax.target.entity}"
+
+
+@dataclass(slots=True)
 class SessionState:
     """State for a single session."""
     session_id: str
     dataset_id: str
-    staged_relaxations: List[StagedRelaxation] = field(default_factory=list)
+    # Staged relaxations by staged id, in staging order (dicts keep insertion
+    # order), plus an index by relaxation id
+    staged_by_id: Dict[str, StagedRelaxation] = field(default_factory=dict)
+    staged_by_relax_id: Dict[str, StagedRelaxation] = field(default_factory=dict)
+    # Estimated impact per type:entity, kept in step with staged_by_id;
+    # impact_counts tracks how many staged relaxations feed each key so that
+    # keys whose impacts sum to zero are still reported.
+    estimated_impact: Dict[str, int] = field(default_factory=dict)
+    impact_counts: Dict[str, int] = field(default_factory=dict)
     last_explanation: Optional[ExplanationResponse] = None
     planned_defense_ids: List[int] = field(default_factory=list)
-    created_at: float = field(default_factory=time.time)
-    updated_at: float = field(default_factory=time.time)
+    # Monotonic clock readings; only used for TTL expiry
+    created_at: float = field(default_factory=time.monotonic)
+    updated_at: float = field(default_factory=time.monotonic)
 
     def touch(self):
-        """Update the last-accessed timestamp."""
-        self.updated_at = time.time()
+        """Update the last-accessed timestamp (at most every few seconds)."""
+        now = time.monotonic()
+        if now - self.updated_at >= _TOUCH_INTERVAL:
+            self.updated_at = now
+
+    @property
+    def staged_relaxations(self) -> List[StagedRelaxation]:
+        """Staged relaxations in staging order, as a new list."""
+        return list(self.staged_by_id.values())
+
+    def clear_staged(self):
+        """Drop all staged relaxations along with their indexes."""
+        self.staged_by_id = {}
+        self.staged_by_relax_id = {}
+        self.estimated_impact = {}
+        self.impact_counts = {}
+
+    def add_staged(self, staged: StagedRelaxation):
+        """Append a staged relaxation, updating indexes and impact."""
+        relax = staged.relaxation
+        key = _impact_key(relax)
+        impact = dict(self.estimated_impact)
+        impact[key] = impact.get(key, 0) + relax.estimated_impact
+        self.impact_counts[key] = self.impact_counts.get(key, 0) + 1
+        self.staged_by_id[staged.id] = staged
+        self.staged_by_relax_id[relax.id] = staged
+        self.estimated_impact = impact
+
+    def remove_staged(self, removed: List[StagedRelaxation]):
+        """Remove staged relaxations, updating indexes and impact."""
+        impact = dict(self.estimated_impact)
+        for staged in removed:
+            if self.staged_by_id.pop(staged.id, None) is None:
+                continue
+            relax = staged.relaxation
+            self.staged_by_relax_id.pop(relax.id, None)
+            key = _impact_key(relax)
+            count = self.impact_counts[key] - 1
+            if count:
+                self.impact_counts[key] = count
+                impact[key] -= relax.estimated_impact
+            else:
+                del self.impact_counts[key]
+                del impact[key]
+        self.estimated_impact = impact
 
 
 class SessionManager:
     """
     Manages per-session state for staged relaxations.
 
-    Thread-safe with automatic cleanup of stale sessions.
+    Thread-safe with automatic cleanup of stale sessions. Mutations of a
+    session are serialized by one of a fixed set of striped locks, picked by
+    session id, so distinct sessions rarely contend; ``_dict_lock`` only
+    guards inserting into / deleting from ``_sessions`` and the expiry heap
+    (always taken after a stripe, never before). Read-only accessors skip
+    locking: single dict operations, including copying a dict's values into a
+    list, are atomic, and ``estimated_impact`` is copy-on-write (always
+    replaced, never mutated in place), so a reader sees either the old or the
+    new state.
     """
 
     def __init__(self, ttl_seconds: int = 3600, cleanup_interval: int = 300):
@@ -59,7 +131,11 @@ class SessionManager:
             cleanup_interval: Interval for cleanup task in seconds (default: 5 minutes).
         """
         self._sessions: Dict[str, SessionState] = {}
-        self._lock = threading.RLock()
+        # Min-heap of (expiry, session_id, created_at), one entry per live
+        # session; entries are re-pushed lazily when the session was touched.
+        self._expiry_heap: List[Tuple[float, str, float]] = []
+        self._locks = [threading.RLock() for _ in range(_LOCK_STRIPES)]
+        self._dict_lock = threading.Lock()
         self._ttl = ttl_seconds
         self._cleanup_interval = cleanup_interval
         self._cleanup_thread: Optional[threading.Thread] = None
@@ -84,6 +160,10 @@ class SessionManager:
             self._cleanup_thread.join(timeout=5)
             self._cleanup_thread = None
 
+    def _lock_for(self, session_id: str) -> threading.RLock:
+        """Return the stripe lock guarding a session."""
+        return self._locks[hash(session_id) & (_LOCK_STRIPES - 1)]
+
     def get_or_create(self, session_id: str, dataset_id: str) -> SessionState:
         """
         Get existing session or create a new one.
@@ -95,13 +175,13 @@ class SessionManager:
         Returns:
             SessionState for the session.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             if session_id in self._sessions:
                 session = self._sessions[session_id]
                 # Update dataset_id if it changed
                 if session.dataset_id != dataset_id:
                     session.dataset_id = dataset_id
-                    session.staged_relaxations = []  # Clear staged on dataset change
+                    session.clear_staged()  # Clear staged on dataset change
                 session.touch()
                 return session
 
@@ -109,7 +189,12 @@ class SessionManager:
                 session_id=session_id,
                 dataset_id=dataset_id
             )
-            self._sessions[session_id] = session
+            with self._dict_lock:
+                self._sessions[session_id] = session
+                heapq.heappush(
+                    self._expiry_heap,
+                    (session.created_at + self._ttl, session_id, session.created_at),
+                )
             return session
 
     def get(self, session_id: str) -> Optional[SessionState]:
@@ -122,11 +207,10 @@ class SessionManager:
         Returns:
             SessionState if found, None otherwise.
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session:
-                session.touch()
-            return session
+        session = self._sessions.get(session_id)
+        if session:
+            session.touch()
+        return session
 
     def stage_relaxation(
         self,
@@ -146,24 +230,24 @@ class SessionManager:
         Raises:
             KeyError: If session doesn't exist.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if not session:
                 raise KeyError(f"Session not found: {session_id}")
 
-            # Check for duplicates
-            for existing in session.staged_relaxations:
-                if existing.relaxation.id == relaxation.id:
-                    # Already staged, just return it
-                    return existing
+            # Already staged, just return it
+            existing = session.staged_by_relax_id.get(relaxation.id)
+            if existing is not None:
+                return existing
 
-            staged = StagedRelaxation(
+            # All fields are built here from an already-validated relaxation
+            staged = StagedRelaxation.model_construct(
                 id=str(uuid.uuid4()),
                 relaxation=relaxation,
                 staged_at=time.time(),
                 status="pending"
             )
-            session.staged_relaxations.append(staged)
+            session.add_staged(staged)
             session.touch()
             return staged
 
@@ -178,18 +262,24 @@ class SessionManager:
         Returns:
             True if removed, False if not found.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if not session:
                 return False
 
-            original_len = len(session.staged_relaxations)
-            session.staged_relaxations = [
-                s for s in session.staged_relaxations
-                if s.id != relaxation_id and s.relaxation.id != relaxation_id
-            ]
             session.touch()
-            return len(session.staged_relaxations) < original_len
+            removed = [
+                s for s in (
+                    session.staged_by_id.get(relaxation_id),
+                    session.staged_by_relax_id.get(relaxation_id),
+                )
+                if s is not None
+            ]
+            if not removed:
+                return False
+
+            session.remove_staged(removed)
+            return True
 
     def get_staged(self, session_id: str) -> List[StagedRelaxation]:
         """
@@ -201,12 +291,11 @@ class SessionManager:
         Returns:
             List of staged relaxations.
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if not session:
-                return []
-            session.touch()
-            return list(session.staged_relaxations)
+        session = self._sessions.get(session_id)
+        if not session:
+            return []
+        session.touch()
+        return session.staged_relaxations
 
     def get_staged_response(self, session_id: str) -> StagedRelaxationsResponse:
         """
@@ -218,30 +307,22 @@ class SessionManager:
         Returns:
             StagedRelaxationsResponse with staged relaxations and estimated impact.
         """
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if not session:
-                return StagedRelaxationsResponse(
-                    session_id=session_id,
-                    staged=[],
-                    estimated_impact={}
-                )
-
-            session.touch()
-
-            # Compute estimated impact (simplified - count relaxations per type)
-            impact: Dict[str, int] = {}
-            for staged in session.staged_relaxations:
-                relax = staged.relaxation
-                key = f"{relax.type.value}:{relax.target.entity}"
-                impact[key] = impact.get(key, 0) + relax.estimated_impact
-
+        session = self._sessions.get(session_id)
+        if not session:
             return StagedRelaxationsResponse(
                 session_id=session_id,
-                staged=list(session.staged_relaxations),
-                estimated_impact=impact
+                staged=[],
+                estimated_impact={}
             )
 
+        session.touch()
+
+        return StagedRelaxationsResponse(
+            session_id=session_id,
+            staged=session.staged_relaxations,
+            estimated_impact=dict(session.estimated_impact)
+        )
+
     def validate_staged(self, session_id: str) -> ValidationResult:
         """
         Validate staged relaxations server-side.
@@ -257,7 +338,7 @@ class SessionManager:
         Returns:
             ValidationResult with validation status and any errors.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if not session:
                 return ValidationResult(
@@ -268,28 +349,28 @@ class SessionManager:
             errors: List[str] = []
             warnings: List[str] = []
 
-            for staged in session.staged_relaxations:
+            error_ids: Set[str] = set()
+
+            for staged in session.staged_by_id.values():
                 relax = staged.relaxation
 
                 # Validate type
                 if relax.type is None:
                     errors.append(f"Relaxation {relax.id} has no type")
-                    continue
-
+                    error_ids.add(relax.id)
                 # Validate target
-                if not relax.target or not relax.target.entity:
+                elif not relax.target or not relax.target.entity:
                     errors.append(f"Relaxation {relax.id} has empty target")
-                    continue
-
+                    error_ids.add(relax.id)
                 # Check for empty slots when required
-                if relax.type.value == "person_availability" and not relax.target.slots:
+                elif relax.type.value == "person_availability" and not relax.target.slots:
                     warnings.append(
                         f"Relaxation {relax.id} for {relax.target.entity} has no specific slots"
                     )
 
             # Update validation status on staged items
-            for staged in session.staged_relaxations:
-                if any(relax.id in err for err in errors for relax in [staged.relaxation]):
+            for staged in session.staged_by_id.values():
+                if staged.relaxation.id in error_ids:
                     staged.status = "error"
                     staged.validation_error = "Validation failed"
                 else:
@@ -314,12 +395,12 @@ class SessionManager:
         Returns:
             True if session was found and cleared, False otherwise.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if not session:
                 return False
 
-            session.staged_relaxations = []
+            session.clear_staged()
             session.last_explanation = None
             session.touch()
             return True
@@ -334,7 +415,7 @@ class SessionManager:
         Returns:
             True if deleted, False if not found.
         """
-        with self._lock:
+        with self._lock_for(session_id), self._dict_lock:
             if session_id in self._sessions:
                 del self._sessions[session_id]
                 return True
@@ -352,7 +433,7 @@ class SessionManager:
             session_id: Session identifier.
             planned_defense_ids: New list of planned defense IDs.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if session:
                 session.planned_defense_ids = list(planned_defense_ids)
@@ -370,7 +451,7 @@ class SessionManager:
             session_id: Session identifier.
             explanation: The explanation response to store.
         """
-        with self._lock:
+        with self._lock_for(session_id):
             session = self._sessions.get(session_id)
             if session:
                 session.last_explanation = explanation
@@ -383,17 +464,30 @@ class SessionManager:
         Returns:
             Number of sessions removed.
         """
-        cutoff = time.time() - self._ttl
+        now = time.monotonic()
         removed = 0
 
-        with self._lock:
-            stale = [
-                sid for sid, session in self._sessions.items()
-                if session.updated_at < cutoff
-            ]
-            for sid in stale:
-                del self._sessions[sid]
-                removed += 1
+        heap = self._expiry_heap
+        with self._dict_lock:
+            due = []
+            while heap and heap[0][0] < now:
+                due.append(heapq.heappop(heap))
+
+        # Re-check each candidate under its stripe so a concurrent write
+        # cannot land on a session that is being dropped
+        for _, sid, created_at in due:
+            with self._lock_for(sid):
+                session = self._sessions.get(sid)
+                if session is None or session.created_at != created_at:
+                    # Entry belongs to a deleted (or since recreated) session
+                    continue
+                expiry = session.updated_at + self._ttl
+                with self._dict_lock:
+                    if expiry < now:
+                        del self._sessions[sid]
+                        removed += 1
+                    else:
+                        heapq.heappush(heap, (expiry, sid, created_at))
 
         if removed > 0:
             logger.info(f"Cleaned up {removed} stale session(s)")
@@ -402,8 +496,7 @@ class SessionManager:
 
     def get_session_count(self) -> int:
         """Get the current number of active sessions."""
-        with self._lock:
-            return len(self._sessions)
+        return len(self._sessions)
 
 
 # Global singleton instance
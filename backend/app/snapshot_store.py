@@ -1,77 +1,272 @@
 from __future__ import annotations
 
-import json
-import uuid
+import functools
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# config creates SNAPSHOT_DIR at import, so the functions below don't mkdir it
 from .config import SNAPSHOT_DIR
+from .json_utils import read_json
+
+# Sidecar holding each snapshot's list entry, so listing doesn't parse every
+# snapshot file. Its leading underscore keeps it apart from the hex snapshot ids.
+_INDEX_NAME = "_index.json"
+_INDEX_LOCK_NAME = "_index.lock"
 
-@dataclass
+# flock serializes index updates across worker processes; the thread lock
+# covers platforms without fcntl
+_index_thread_lock = threading.Lock()
+
+@dataclass(slots=True, frozen=True)
 class Snapshot:
     id: str
     name: str
     description: Optional[str]
     created_at: str
     path: Path
+    size_bytes: int
+
+
+_SNAPSHOT_ID_RE = re.compile(r"[0-9a-f]{12}")
 
 
 def _snapshot_path(snapshot_id: str) -> Path:
     return SNAPSHOT_DIR / f"{snapshot_id}.json"
 
 
-def save_snapshot(name: str, description: Optional[str], state: Dict) -> Snapshot:
-    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
-    snapshot_id = uuid.uuid4().hex[:12]
-    path = _snapshot_path(snapshot_id)
-    payload = {
-        "id": snapshot_id,
-        "name": name,
-        "description": description,
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "state": state,
+def _check_snapshot_id(snapshot_id: str) -> None:
+    # Ids are joined into a file path; only accept the ids save_snapshot issues
+    if not _SNAPSHOT_ID_RE.fullmatch(snapshot_id):
+        raise ValueError("Invalid snapshot id")
+
+
+def _state_meta(state: Dict) -> Dict:
+    return {
+        "roster_count": len(state.get("assignments", [])),
+        "event_count": len(state.get("entities", [])),
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    return Snapshot(
-        id=snapshot_id,
-        name=name,
-        description=description,
-        created_at=payload["created_at"],
-        path=path,
-    )
 
 
-def list_snapshots() -> List[Dict]:
-    items = []
-    for path in sorted(SNAPSHOT_DIR.glob("*.json")):
-        data = json.loads(path.read_text(encoding="utf-8"))
-        items.append(
-            {
-                "id": data["id"],
-                "name": data["name"],
-                "description": data.get("description"),
-                "created_at": data["created_at"],
-                "size_bytes": path.stat().st_size,
-                "roster_count": len(data.get("state", {}).get("assignments", [])),
-                "event_count": len(data.get("state", {}).get("entities", [])),
+def _list_entry(data: Dict, size_bytes: int) -> Dict:
+    meta = data.get("meta") or _state_meta(data.get("state", {}))
+    return {
+        "id": data["id"],
+        "name": data["name"],
+        "description": data.get("description"),
+        "created_at": data["created_at"],
+        "size_bytes": size_bytes,
+        "roster_count": meta["roster_count"],
+        "event_count": meta["event_count"],
+    }
+
+
+# Snapshots are written with "state" as the last key, after a "meta" header
+# holding its counts. In compact JSON a quote inside a string value is always
+# escaped, so the first occurrence of this marker is the "state" key itself.
+_STATE_MARKER = b',"state":'
+_HEADER_READ_BYTES = 64 * 1024
+
+
+def _read_header(path: Path) -> Dict:
+    """Parse a snapshot's fields up to (not including) its state, when possible."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER_READ_BYTES)
+    cut = head.find(_STATE_MARKER)
+    if cut != -1:
+        try:
+            header = orjson.loads(head[:cut] + b"}")
+        except orjson.JSONDecodeError:
+            header = None
+        if header is not None and "meta" in header:
+            return header
+    # Snapshots from before the header (or with huge names): parse it all
+    if len(head) < _HEADER_READ_BYTES:
+        return orjson.loads(head)
+    return read_json(path)
+
+
+@contextmanager
+def _locked_index():
+    with _index_thread_lock, open(SNAPSHOT_DIR / _INDEX_LOCK_NAME, "ab") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _read_index() -> Dict[str, Dict]:
+    try:
+        return orjson.loads((SNAPSHOT_DIR / _INDEX_NAME).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        # Missing or torn index: list_snapshots rebuilds it from the files
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a synced temp file and rename, so readers never see a torn file."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist renames into ``path``; a no-op where directories can't be opened (Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_index(index: Dict[str, Dict]) -> None:
+    _write_atomic(SNAPSHOT_DIR / _INDEX_NAME, orjson.dumps(index))
+
+
+def _snapshot_files() -> Dict[str, os.DirEntry]:
+    """Map snapshot id -> directory entry, from a single scandir pass."""
+    try:
+        with os.scandir(SNAPSHOT_DIR) as it:
+            return {
+                entry.name[:-5]: entry
+                for entry in it
+                if entry.name.endswith(".json") and not entry.name.startswith("_")
             }
+    except FileNotFoundError:
+        return {}
+
+
+def _new_snapshot_id() -> str:
+    # 48 random bits, as before, without building a full UUID; regenerate on the
+    # (very unlikely) clash rather than letting os.replace overwrite a snapshot
+    while True:
+        snapshot_id = os.urandom(6).hex()
+        if not _snapshot_path(snapshot_id).exists():
+            return snapshot_id
+
+
+def save_snapshot(name: str, description: Optional[str], state: Dict) -> Snapshot:
+    return save_snapshots([(name, description, state)])[0]
+
+
+def save_snapshots(items: Iterable[Tuple[str, Optional[str], Dict]]) -> List[Snapshot]:
+    """Save several snapshots, syncing the directory and rewriting the index once."""
+    snapshots: List[Snapshot] = []
+    entries: Dict[str, Dict] = {}
+    for name, description, state in items:
+        snapshot_id = _new_snapshot_id()
+        path = _snapshot_path(snapshot_id)
+        created_at = datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+        payload = {
+            "id": snapshot_id,
+            "name": name,
+            "description": description,
+            "created_at": created_at,
+            "meta": _state_meta(state),
+            "state": state,
+        }
+        encoded = orjson.dumps(payload)
+        _write_atomic(path, encoded)
+        entries[snapshot_id] = _list_entry(payload, len(encoded))
+        snapshots.append(
+            Snapshot(
+                id=snapshot_id,
+                name=name,
+                description=description,
+                created_at=created_at,
+                path=path,
+                size_bytes=len(encoded),
+            )
         )
-    return items
+    if not snapshots:
+        return snapshots
+    _fsync_dir(SNAPSHOT_DIR)
+    with _locked_index():
+        index = _read_index()
+        index.update(entries)
+        _write_index(index)
+    return snapshots
+
+
+def _read_list_entry(entry: os.DirEntry) -> Optional[Dict]:
+    try:
+        return _list_entry(_read_header(Path(entry.path)), entry.stat().st_size)
+    except FileNotFoundError:
+        return None
+
+
+def list_snapshots() -> List[Dict]:
+    files = _snapshot_files()
+    index = _read_index()
+    if index.keys() != files.keys():
+        # Snapshots written before the index existed, or changed behind our
+        # back: parse only the files the index doesn't know about.
+        with _locked_index():
+            index = _read_index()
+            for stale in index.keys() - files.keys():
+                del index[stale]
+            missing = sorted(files.keys() - index.keys())
+            if len(missing) > 1:
+                # A full rebuild (e.g. first listing after an upgrade) reads
+                # every snapshot; overlap the cold-cache reads.
+                with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+                    entries = list(pool.map(_read_list_entry, (files[i] for i in missing)))
+            else:
+                entries = [_read_list_entry(files[i]) for i in missing]
+            for snapshot_id, list_entry in zip(missing, entries):
+                if list_entry is not None:
+                    index[snapshot_id] = list_entry
+            _write_index(index)
+    return [index[snapshot_id] for snapshot_id in sorted(files) if snapshot_id in index]
+
+
+# Keyed on the file's mtime and size so a rewritten snapshot is re-read; the
+# parsed dicts are shared between callers and must not be mutated.
+@functools.lru_cache(maxsize=32)
+def _load_parsed(snapshot_id: str, mtime_ns: int, size: int) -> Dict:
+    return read_json(_snapshot_path(snapshot_id))
 
 
 def load_snapshot(snapshot_id: str) -> Dict:
-    path = _snapshot_path(snapshot_id)
-    if not path.exists():
-        raise FileNotFoundError("Snapshot not found")
-    return json.loads(path.read_text(encoding="utf-8"))
+    _check_snapshot_id(snapshot_id)
+    try:
+        stat = _snapshot_path(snapshot_id).stat()
+    except FileNotFoundError:
+        raise FileNotFoundError("Snapshot not found") from None
+    data = _load_parsed(snapshot_id, stat.st_mtime_ns, stat.st_size)
+    # "meta" only backs listings; keep it out of the loaded snapshot (a
+    # shallow copy, since the cached dict is shared)
+    return {key: value for key, value in data.items() if key != "meta"}
 
 
 def delete_snapshot(snapshot_id: str) -> None:
-    path = _snapshot_path(snapshot_id)
-    if path.exists():
-        path.unlink()
+    _check_snapshot_id(snapshot_id)
+    try:
+        _snapshot_path(snapshot_id).unlink()
+    except FileNotFoundError:
+        pass
+    with _locked_index():
+        index = _read_index()
+        if index.pop(snapshot_id, None) is not None:
+            _write_index(index)
 
 
-__all__ = ["save_snapshot", "list_snapshots", "load_snapshot", "delete_snapshot"]
+__all__ = ["save_snapshot", "save_snapshots", "list_snapshots", "load_snapshot", "delete_snapshot"]
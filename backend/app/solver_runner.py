@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import importlib
 import importlib.util
 import logging
 import os
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -13,9 +16,16 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
+
+try:
+    from yaml import CSafeDumper as _YAMLDumper, CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YAMLDumper, SafeLoader as _YAMLLoader
+
 from .config import DATA_OUTPUT_DIR, SOLVER_SRC_DIR
 from .datasets import load_dataset, ensure_dataset
 from .analysis import detect_conflicts
+from .repair_applicator import load_active_repairs, apply_repairs_to_data
 
 
 REQUIRED_SOLVER_ATTRS = (
@@ -51,9 +61,28 @@ def _load_solver_module():
     return module
 
 
-solver_module = _load_solver_module()
+# solver.py pulls in pandas and plotly; load it on the first solve rather than
+# when the API process starts.
+_solver_module = None
+_solver_module_lock = threading.Lock()
+
+
+def get_solver_module():
+    """Return the solver module, loading it on first use (shared by all callers)."""
+    global _solver_module
+    if _solver_module is None:
+        with _solver_module_lock:
+            if _solver_module is None:
+                _solver_module = _load_solver_module()
+    return _solver_module
+
+
 logger = logging.getLogger("uvicorn.error")
 
+# Parsed dataset solver configs: path -> (mtime_ns, size, parsed document)
+_YAML_CACHE: Dict[str, tuple] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
 DEFAULT_SOLVER_SETTINGS = {
     "input_data": "examples/medium",
     "output_dir": "data/output",
@@ -76,6 +105,39 @@ DEFAULT_SOLVER_SETTINGS = {
     "must_plan_all_defenses": False,
 }
 
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-", "|": "-", ".": "-"})
+
+
+# Participant names and ids repeat across defenses and across solves; both
+# helpers are pure functions of a string, so memoize them.
+@functools.lru_cache(maxsize=8192)
+def _slug_text(text: str) -> str:
+    return text.strip().lower().translate(_SLUG_TABLE)
+
+
+def _slug(value: Optional[Any]) -> str:
+    if value is None:
+        return ""
+    return _slug_text(str(value))
+
+
+@functools.lru_cache(maxsize=8192)
+def _clean_text_id(text: str) -> Optional[str]:
+    text = text.strip()
+    if not text or text.lower() == "nan":
+        return None
+    return text
+
+
+def _clean_id(value: Optional[Any]) -> Optional[str]:
+    # Cache on the string form: raw values may be unhashable, and 1 / 1.0
+    # hash alike but render differently
+    if value is None:
+        return None
+    return _clean_text_id(str(value))
+
 
 @dataclass
 class AvailabilityOverride:
@@ -109,8 +171,9 @@ class SolverOptions:
 
 
 class SolverRunner:
-    def __init__(self) -> None:
-        self._module = solver_module
+    @property
+    def _module(self):
+        return get_solver_module()
 
     def _build_config(
         self,
@@ -169,16 +232,28 @@ class SolverRunner:
         candidates = ["solver.yml", "solver.yaml", "config.yml", "config.yaml"]
         for name in candidates:
             path = dataset_path / name
-            if not path.exists():
-                continue
             try:
-                with path.open("r", encoding="utf-8") as handle:
-                    data = yaml.safe_load(handle) or {}
-                    if isinstance(data, dict):
-                        return data
-                    logger.warning("Ignoring solver config %s because it does not contain key/value mappings", path)
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("Failed to parse solver config %s: %s", path, exc)
+                stat = path.stat()
+            except OSError:
+                continue
+            key = str(path)
+            with _YAML_CACHE_LOCK:
+                cached = _YAML_CACHE.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                data = cached[2]
+            else:
+                try:
+                    with path.open("r", encoding="utf-8") as handle:
+                        data = yaml.load(handle, Loader=_YAMLLoader) or {}
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Failed to parse solver config %s: %s", path, exc)
+                    continue
+                with _YAML_CACHE_LOCK:
+                    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+            if isinstance(data, dict):
+                # Callers merge and adjust the config; keep the cached copy pristine
+                return copy.deepcopy(data)
+            logger.warning("Ignoring solver config %s because it does not contain key/value mappings", path)
         return {}
 
     @staticmethod
@@ -202,31 +277,34 @@ class SolverRunner:
         if opts.config_yaml:
             (run_path / "solver_config_request.yaml").write_text(opts.config_yaml, encoding="utf-8")
         (run_path / "solver_config_resolved.yaml").write_text(
-            yaml.safe_dump(cfg, sort_keys=False),
+            yaml.dump(cfg, Dumper=_YAMLDumper, sort_keys=False),
             encoding="utf-8",
         )
 
     @staticmethod
     def _apply_ortools_parameters(solver, cfg: Dict[str, Any], opts: SolverOptions) -> None:
-        ort_solver = getattr(solver, "ort_solver", None)
-        parameters = getattr(ort_solver, "parameters", None)
-        if parameters is None:
-            return
         time_limit = cfg.get("solver_time_limit_sec")
         if time_limit is None:
             time_limit = cfg.get("max_time_in_seconds")
         if time_limit is None:
             time_limit = opts.timeout
+        workers = cfg.get("solver_workers")
+        if workers is None and cfg.get("must_plan_all_defenses") is False:
+            cpu_count = os.cpu_count() or 1
+            workers = min(2, cpu_count)
+        if not time_limit and workers is None:
+            # Nothing to override: leave CP-SAT on its own defaults
+            return
+        ort_solver = getattr(solver, "ort_solver", None)
+        parameters = getattr(ort_solver, "parameters", None)
+        if parameters is None:
+            return
         if time_limit:
             try:
                 parameters.max_time_in_seconds = float(time_limit)
                 cfg["solver_time_limit_sec"] = float(time_limit)
             except Exception:
                 pass
-        workers = cfg.get("solver_workers")
-        if workers is None and cfg.get("must_plan_all_defenses") is False:
-            cpu_count = os.cpu_count() or 1
-            workers = min(2, cpu_count)
         if workers is not None:
             try:
                 resolved_workers = int(max(1, workers))
@@ -244,6 +322,21 @@ class SolverRunner:
             return var.value()
         return var
 
+    @staticmethod
+    def _var_values(variables, count: int) -> List[Any]:
+        """Values of the first ``count`` variables, read with one array-level value() call when possible."""
+        bulk = getattr(variables, "value", None)
+        if callable(bulk):
+            try:
+                values = bulk()
+            except Exception:
+                values = None
+            if hasattr(values, "tolist"):
+                values = values.tolist()
+                if isinstance(values, list) and len(values) >= count:
+                    return values[:count]
+        return [SolverRunner._get_var_value(variables[d]) for d in range(count)]
+
     def _assignment_rows(
         self,
         model,
@@ -252,7 +345,7 @@ class SolverRunner:
         include_participants: bool = True,
     ) -> List[Dict]:  # type: ignore
         assignments = []
-        first_day = datetime.strptime(timeslot_info["first_day"], "%Y-%m-%d")
+        first_day = datetime.strptime(timeslot_info["first_day"], "%Y-%m-%d").date()
         start_hour = int(timeslot_info["start_hour"])
         end_hour = int(timeslot_info["end_hour"])
         hours_per_day = end_hour - start_hour
@@ -267,22 +360,36 @@ class SolverRunner:
             "mentor3",
             "mentor4",
         ] if include_participants else []
-        for d in range(model.no_defenses):
+        # slot index -> (date, day name, start time, end time); many defenses share a slot
+        slot_times: Dict[int, tuple] = {}
+        count = model.no_defenses
+        planned_values = self._var_values(model.is_planned, count)
+        start_values = self._var_values(model.start_times, count)
+        room_values = self._var_values(model.in_room, count)
+        # One conversion instead of a label lookup (and Series build) per row
+        entities = model.df_def.to_dict("index")
+        for d, planned_value, start_val, room_val in zip(range(count), planned_values, start_values, room_values):
             raw_row = raw_defences[d] if raw_defences and d < len(raw_defences) else {}
-            planned_value = self._get_var_value(model.is_planned[d])
             if planned_value is not None and not bool(planned_value):
                 continue
-            start_val = self._get_var_value(model.start_times[d])
-            room_val = self._get_var_value(model.in_room[d])
             if start_val is None or room_val is None:
                 continue
             slot_index = int(start_val)
             room_idx = int(room_val)
-            timestamp = first_day + timedelta(hours=slot_index)
-            start_time = timestamp.strftime("%H:%M")
-            end_time = (timestamp + timedelta(hours=1)).strftime("%H:%M")
+            slot_fields = slot_times.get(slot_index)
+            if slot_fields is None:
+                # Slot indices count hours from midnight of first_day
+                day_offset, hour = divmod(slot_index, 24)
+                day = first_day + timedelta(days=day_offset)
+                slot_fields = slot_times[slot_index] = (
+                    day.isoformat(),
+                    _WEEKDAYS[day.weekday()],
+                    f"{hour:02d}:00",
+                    f"{(hour + 1) % 24:02d}:00",
+                )
+            date_str, day_name, start_time, end_time = slot_fields
             day_index = slot_index // hours_per_day
-            entity = model.df_def.loc[d]
+            entity = entities[d]
             participant_ids = []
             if include_participants:
                 for col in participant_cols:
@@ -292,7 +399,7 @@ class SolverRunner:
                     name_str = str(name).strip()
                     if not name_str:
                         continue
-                    participant_ids.append(self._slug(name_str))
+                    participant_ids.append(_slug(name_str))
             defense_id = self._resolve_entity_id(d, entity, raw_row)
             assignments.append(
                 {
@@ -303,8 +410,8 @@ class SolverRunner:
                     "resource_name": model.rooms[room_idx] if room_idx < len(model.rooms) else "Room",
                     "timeslot_id": f"ts-{slot_index}",
                     "day_index": day_index,
-                    "date": timestamp.date().isoformat(),
-                    "day_name": timestamp.strftime("%A"),
+                    "date": date_str,
+                    "day_name": day_name,
                     "start_time": start_time,
                     "end_time": end_time,
                     "participant_ids": participant_ids,
@@ -316,47 +423,26 @@ class SolverRunner:
             )
         return assignments
 
-    @staticmethod
-    def _clean_id(value: Optional[Any]) -> Optional[str]:
-        if value is None:
-            return None
-        text = str(value).strip()
-        if not text or text.lower() == "nan":
-            return None
-        return text
-
     def _resolve_entity_id(self, index: int, df_row, raw_row: Optional[Dict[str, Any]] = None) -> str:
         candidates: List[Optional[str]] = []
         if raw_row:
             for key in ("defense_id", "defence_id", "event_id", "id"):
-                candidates.append(self._clean_id(raw_row.get(key)))
+                candidates.append(_clean_id(raw_row.get(key)))
             metadata = raw_row.get("metadata")
             if isinstance(metadata, str) and metadata.strip():
                 try:
                     meta = json.loads(metadata)
                     for key in ("id", "event_id", "defense_id", "defence_id"):
-                        candidates.append(self._clean_id(meta.get(key)))
+                        candidates.append(_clean_id(meta.get(key)))
                 except json.JSONDecodeError:
                     pass
         for key in ("entity_id", "external_id", "defense_id", "defence_id"):
-            candidates.append(self._clean_id(df_row.get(key)))
+            candidates.append(_clean_id(df_row.get(key)))
         for candidate in candidates:
             if candidate:
                 return candidate
         return f"def-{index+1}"
 
-    @staticmethod
-    def _slug(value: str) -> str:
-        if value is None:
-            return ""
-        text = str(value).strip().lower()
-        return (
-            text.replace(" ", "-")
-            .replace("/", "-")
-            .replace("|", "-")
-            .replace(".", "-")
-        )
-
     def solve(self, opts: SolverOptions) -> Dict:
         start_wall = time.monotonic()
         dataset_dir = Path(ensure_dataset(opts.dataset))
@@ -368,7 +454,6 @@ class SolverRunner:
         # Apply availability overrides if provided (e.g., from conflict resolution repairs)
         unavail = self._apply_availability_overrides(unavail, opts.availability_overrides)
         # Apply active repairs from metadata file (non-destructive, in-memory)
-        from .repair_applicator import load_active_repairs, apply_repairs_to_data
         active_repairs = load_active_repairs(opts.dataset)
         unavail_before = len(unavail)
         if active_repairs:
@@ -1018,7 +1103,6 @@ class SolverRunner:
         # Apply availability overrides if provided (e.g., from conflict resolution repairs)
         unavail = self._apply_availability_overrides(unavail, opts.availability_overrides)
         # Apply active repairs from metadata file (non-destructive, in-memory)
-        from .repair_applicator import load_active_repairs, apply_repairs_to_data
         active_repairs = load_active_repairs(opts.dataset)
         unavail_before = len(unavail)
         if active_repairs:
@@ -1605,4 +1689,4 @@ class SolverRunner:
 
 runner = SolverRunner()
 
-__all__ = ["SolverRunner", "SolverOptions", "runner"]
+__all__ = ["SolverRunner", "SolverOptions", "get_solver_module", "runner"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import multiprocessing as mp
 import queue
@@ -58,6 +59,32 @@ class _QueueWriter:
             self._buffer = ""
 
 
+class AsyncSubscriber:
+    """Thread-safe handle feeding an asyncio.Queue owned by the subscribing event loop."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def put_nowait(self, item: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, item)
+        except RuntimeError:
+            pass  # loop already closed; the subscriber is gone
+
+    def qsize(self) -> int:
+        return self.queue.qsize()
+
+    def _put(self, item: Any) -> None:
+        # Runs on the event loop: drop the oldest entry rather than block publishers
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(item)
+
+
 @dataclass
 class SolverRunRecord:
     id: str
@@ -79,7 +106,7 @@ class SolverRunRecord:
 class SolverStreamChannel:
     def __init__(self, run_id: str = "") -> None:
         self._lock = threading.Lock()
-        self._subscribers: set[queue.Queue] = set()
+        self._subscribers: set[queue.Queue | AsyncSubscriber] = set()
         self._history: list[Dict[str, Any]] = []
         self._closed = False
         self._max_history = 100
@@ -110,6 +137,20 @@ class SolverStreamChannel:
 
     def subscribe(self) -> queue.Queue:
         q: queue.Queue = queue.Queue(maxsize=100)
+        self._attach(q)
+        return q
+
+    def subscribe_async(self) -> AsyncSubscriber:
+        """Subscribe from a coroutine; events arrive on the returned subscriber's asyncio queue."""
+        subscriber = AsyncSubscriber(maxsize=100)
+        self._attach(subscriber)
+        return subscriber
+
+    def unsubscribe(self, q: queue.Queue | AsyncSubscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def _attach(self, q: queue.Queue | AsyncSubscriber) -> None:
         with self._lock:
             history_len = len(self._history)
             closed = self._closed
@@ -131,7 +172,6 @@ class SolverStreamChannel:
                 self._publish_to_queue(q, None)
             else:
                 self._subscribers.add(q)
-        return q
 
     def close(self, payload: Optional[Dict[str, Any]] = None) -> None:
         with self._lock:
@@ -152,7 +192,7 @@ class SolverStreamChannel:
                 self._publish_to_queue(subscriber, None)
             self._subscribers.clear()
 
-    def _publish_to_queue(self, q: queue.Queue, payload: Optional[Dict[str, Any]]) -> None:
+    def _publish_to_queue(self, q: queue.Queue | AsyncSubscriber, payload: Optional[Dict[str, Any]]) -> None:
         try:
             q.put_nowait(payload)
         except queue.Full:
@@ -203,7 +243,7 @@ stream_manager = SolverStreamManager()
 class SolverDebugChannel:
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._subscribers: set[queue.Queue] = set()
+        self._subscribers: set[queue.Queue | AsyncSubscriber] = set()
         self._closed = False
 
     def publish(self, line: str) -> None:
@@ -219,6 +259,20 @@ class SolverDebugChannel:
             self._subscribers.add(q)
         return q
 
+    def subscribe_async(self) -> AsyncSubscriber:
+        """Subscribe from a coroutine; lines arrive on the returned subscriber's asyncio queue."""
+        subscriber = AsyncSubscriber(maxsize=200)
+        with self._lock:
+            if self._closed:
+                subscriber.put_nowait(None)
+            else:
+                self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, q: queue.Queue | AsyncSubscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(q)
+
     def close(self) -> None:
         with self._lock:
             if self._closed:
@@ -227,7 +281,7 @@ class SolverDebugChannel:
             for subscriber in list(self._subscribers):
                 self._publish_to_queue(subscriber, None)
 
-    def _publish_to_queue(self, q: queue.Queue, line: Optional[str]) -> None:
+    def _publish_to_queue(self, q: queue.Queue | AsyncSubscriber, line: Optional[str]) -> None:
         try:
             q.put_nowait(line)
         except queue.Full:
@@ -323,6 +377,12 @@ class SolverRunManager:
         with self._lock:
             return dict(self._runs)
 
+    def list_records(self, dataset_id: Optional[str] = None) -> list[SolverRunRecord]:
+        with self._lock:
+            if dataset_id is None:
+                return list(self._runs.values())
+            return [record for record in self._runs.values() if record.dataset_id == dataset_id]
+
     def get(self, run_id: str) -> Optional[SolverRunRecord]:
         with self._lock:
             return self._runs.get(run_id)
@@ -865,6 +865,19 @@ export function RosterDashboard({
       }
     };
 
+    const handleLogBatchEvent = (event: MessageEvent) => {
+      if (!event.data) return;
+      try {
+        const payload = JSON.parse(event.data) as { lines?: string[] };
+        const lines = payload.lines;
+        if (lines && lines.length > 0) {
+          setSolverLogLines(prev => [...prev, ...lines]);
+        }
+      } catch (err) {
+        logger.error('Failed to parse log batch event', err);
+      }
+    };
+
     const handleCloseEvent = (event: MessageEvent) => {
       if (!event.data) return;
       try {
@@ -881,6 +894,7 @@ export function RosterDashboard({
     };
 
     source.addEventListener('log', handleLogEvent);
+    source.addEventListener('log-batch', handleLogBatchEvent);
     source.addEventListener('close', handleCloseEvent);
     source.addEventListener('heartbeat', () => {
       // noop